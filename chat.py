@@ -1,5 +1,7 @@
+import hashlib
 import json
 import logging
+from collections import OrderedDict
 from typing import Optional
 
 import requests
@@ -10,6 +12,14 @@ try:
 except Exception:  # pragma: no cover - optional dependency
     ollama = None
 
+try:
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers catch either
+_json_loads = orjson.loads if orjson is not None else json.loads
+
 
 class OllamaUnavailableError(RuntimeError):
     """Raised when Ollama client or service is not available."""
@@ -76,7 +86,7 @@ def warmup():
     messages = []
 
     # 1. Initial prompt
-    initial_prompt = "I'll give you an official statement from FOMC. Based on this statement, please tell me: (1) Whether this article describes a Federal Reserve decision about interest rates (including cuts, increases, or maintaining current rates). Your answer must be either Yes or No, and nothing else. I'll give you the statement shortly."
+    initial_prompt = "I'll give you an official statement from FOMC. Based on this statement, please tell me whether this article describes a Federal Reserve decision about interest rates (including cuts, increases, or maintaining current rates) and, if it does, what that decision was. I'll give you the statement shortly."
     messages.append({'role': 'user', 'content': initial_prompt})
     
     response = ollama.chat(model='gemma3:4b', messages=messages)
@@ -85,64 +95,94 @@ def warmup():
     messages.append({'role': 'assistant', 'content': assistant_response})
     return messages
 
-def extract(article_text, messages):
+_warmup_messages: Optional[list] = None
+
+def get_warmup():
     """
-    Performs a structured conversation with the Gemma3 4B model and returns the result.
+    Returns the warmup conversation, running the warmup prompt only once per process.
     """
-    _ensure_ollama_available()
-    # 2. Retrieve and send article
-    if not article_text:
-        return None
+    global _warmup_messages
+    if _warmup_messages is None:
+        _warmup_messages = warmup()
+    # extract() appends to the conversation, so hand out a copy
+    return list(_warmup_messages)
+
+EXTRACTION_PROMPT = """Analyze the statement above and provide your answer in a JSON format with four keys:
+1. "fed_decision": "yes" if the statement describes a Federal Reserve decision about interest rates (including cuts, increases, or maintaining current rates), otherwise "no".
+2. "sentence": The exact sentence that explicitly mentions the Federal Reserve's interest rate decision, or "" if there is none.
+3. "direction": The value should be either "increase", "decrease", or "maintain" (if rates are kept at current levels).
+4. "basis_points": The value should be the number of basis points of the change (e.g., 50 for a 0.50% change, or 0 if rates are maintained).
 
-    messages.append({'role': 'user', 'content': article_text})
-    response = ollama.chat(model='gemma3:4b', messages=messages)
-    assistant_response = response['message']['content'].strip()
-    logging.debug(f"LLM Response: {assistant_response}")
-    messages.append({'role': 'assistant', 'content': assistant_response})
+Your response should only be the JSON object."""
 
-    # 3. If the LLM answers No, the conversation ends.
-    if 'no' in assistant_response.lower():
-        return None
+# Completed extractions keyed by the SHA-1 digest of the article text, oldest first
+_EXTRACT_CACHE_SIZE = 1024
+_extract_cache: "OrderedDict[bytes, Optional[int]]" = OrderedDict()
+_MISSING = object()
 
-    # 4. Ask for the exact sentence
-    sentence_prompt = "Tell me the exact sentence that explicitly mentions the Federal Reserve's interest rate decision (whether it's a cut, increase, or maintaining current rates)."
-    messages.append({'role': 'user', 'content': sentence_prompt})
-    response = ollama.chat(model='gemma3:4b', messages=messages)
-    assistant_response = response['message']['content']
-    logging.debug(f"LLM Response (ignored): {assistant_response}")
-    messages.append({'role': 'assistant', 'content': assistant_response})
 
-    # 5. Ask for the basis points in JSON format
-    basis_points_prompt = """Based on your answer above, analyze the Federal Reserve's interest rate decision and provide your answer in a JSON format with two keys:
-1. "direction": The value should be either "increase", "decrease", or "maintain" (if rates are kept at current levels).
-2. "basis_points": The value should be the number of basis points of the change (e.g., 50 for a 0.50% change, or 0 if rates are maintained).
+def clear_extract_cache() -> None:
+    """Forget every cached extraction result."""
+    _extract_cache.clear()
 
-Your response should only be the JSON object."""
-    messages.append({'role': 'user', 'content': basis_points_prompt})
-    response = ollama.chat(model='gemma3:4b', messages=messages)
+
+def _remember_extract(key: bytes, result: Optional[int]) -> None:
+    """Store an extraction result, evicting the least recently used entry when full."""
+    _extract_cache[key] = result
+    if len(_extract_cache) > _EXTRACT_CACHE_SIZE:
+        _extract_cache.popitem(last=False)
+
+
+def extract(article_text, messages):
+    """
+    Asks the Gemma3 4B model for the rate decision in a single structured request and returns the result.
+    Repeated articles are answered from an in-process LRU cache without contacting the model.
+    """
+    if not article_text or not article_text.strip():
+        return None
+
+    # Cached answers need no model, so look them up before checking the daemon
+    key = hashlib.sha1(article_text.encode('utf-8')).digest()
+    cached = _extract_cache.get(key, _MISSING)
+    if cached is not _MISSING:
+        _extract_cache.move_to_end(key)
+        logging.debug("Returning cached extraction result")
+        return cached
+    _ensure_ollama_available()
+
+    # 2. Send the article together with the extraction instructions
+    messages.append({'role': 'user', 'content': f"{article_text}\n\n{EXTRACTION_PROMPT}"})
+    response = ollama.chat(model='gemma3:4b', messages=messages, format='json')
     assistant_response = response['message']['content'].strip()
     logging.debug(f"LLM Response: {assistant_response}")
     messages.append({'role': 'assistant', 'content': assistant_response})
-    
+
     try:
         # Clean the response to extract only the JSON part
         json_str = assistant_response[assistant_response.find('{'):assistant_response.rfind('}')+1]
-        data = json.loads(json_str)
-        direction = data.get("direction")
-        basis_points = data.get("basis_points")
+        data = _json_loads(json_str)
+
+        # 3. If the statement holds no rate decision, the conversation ends.
+        if str(data.get("fed_decision", "")).strip().lower() not in ("yes", "true"):
+            basis_points = None
+        else:
+            direction = data.get("direction")
+            basis_points = data.get("basis_points")
 
-        if direction == "decrease":
-            basis_points = -basis_points
-        elif direction == "maintain":
-            basis_points = 0
-        
-        return basis_points
+            if direction == "decrease":
+                basis_points = -basis_points
+            elif direction == "maintain":
+                basis_points = 0
 
     except (json.JSONDecodeError, AttributeError, KeyError, TypeError) as e:
+        # Unparseable answers are not cached so the next request retries the model
         logging.error(f"Error parsing LLM response: {e}")
         logging.warning("Could not determine the final answer.")
         return None
 
+    _remember_extract(key, basis_points)
+    return basis_points
+
 if __name__ == "__main__":
     messages = warmup()
     article_url = "https://www.federalreserve.gov/newsevents/pressreleases/monetary20240918a.htm"
@@ -0,0 +1,10 @@
+"""Environment variable helpers shared by the FOMC scripts."""
+
+import os
+
+_TRUTHY = frozenset({"1", "true", "yes", "on"})
+
+
+def bool_env(name: str) -> bool:
+    """Return True if an environment variable is set to a truthy value (1/true/yes/on)."""
+    return os.environ.get(name, "").lower() in _TRUTHY
@@ -23,7 +23,7 @@ from aptos_sdk.bcs import Serializer
 
 # Import existing functionality
 from chat import (
-    warmup,
+    get_warmup,
     extract,
     get_article_text,
     is_ollama_available,
@@ -137,7 +137,7 @@ class FOMCServer:
             return None
 
         try:
-            messages = warmup()
+            messages = get_warmup()
             return extract(text, messages)
         except OllamaUnavailableError as e:
             logger.error(f"Server {self.server_id} - Ollama unavailable: {e}")
@@ -181,7 +181,8 @@ class FOMCServer:
                 "version": "1.0.0",
                 "server_id": self.server_id,
                 "endpoints": {
-                    "/extract": "POST - Extract rate change from text and threshold sign with BLS"
+                    "/extract": "POST - Extract rate change from text and threshold sign with BLS",
+                    "/warmup": "POST - Load the LLM into memory ahead of the first extraction"
                 },
                 "threshold_info": {
                     "threshold": 3,
@@ -215,6 +216,19 @@ class FOMCServer:
             except Exception as e:
                 return {"status": "unhealthy", "error": str(e), "server_id": self.server_id}
         
+        @self.app.post("/warmup")
+        def warmup_model():
+            """Load the LLM and cache the warmup conversation for later extractions."""
+            if not is_ollama_available():
+                return {"status": "skipped", "reason": "Ollama unavailable", "server_id": self.server_id}
+            try:
+                get_warmup()
+            except Exception as e:
+                logger.error(f"Server {self.server_id} - Warmup failed: {e}")
+                return {"status": "failed", "error": str(e), "server_id": self.server_id}
+            logger.info(f"Server {self.server_id} - LLM warmed up")
+            return {"status": "warm", "server_id": self.server_id}
+        
         @self.app.post("/extract", response_model=RateResponse)
         async def extract_rate_and_sign(input_data: TextInput) -> RateResponse:
             """
@@ -1,18 +1,19 @@
 #!/usr/bin/env python3
 import asyncio
+import functools
 import os
+import struct
 import sys
 from dataclasses import dataclass
-from typing import Optional
+from typing import List, Optional
 
 import yaml
 from aptos_sdk.account import Account
 from aptos_sdk.account_address import AccountAddress
 from aptos_sdk.async_client import RestClient
-from aptos_sdk.bcs import Serializer
 from aptos_sdk.transactions import (
     EntryFunction,
-    TransactionArgument,
+    ModuleId,
     TransactionPayload,
 )
 from aptos_sdk.type_tag import StructTag, TypeTag
@@ -32,6 +33,9 @@ CURVE_TYPE = os.environ.get(
     "CURVE_TYPE", f"{LIQUIDSWAP_ADDR}::curves::Uncorrelated"
 )
 SCRIPTS_MODULE = f"{LIQUIDSWAP_ADDR}::scripts"
+_SCRIPTS_MODULE_ID = ModuleId.from_str(SCRIPTS_MODULE)
+# BCS encodes a u64 as 8 little-endian bytes
+_U64 = struct.Struct("<Q")
 
 
 @dataclass
@@ -67,6 +71,12 @@ async def load_ctx() -> Ctx:
     return Ctx(rest=rest, account=account, address=account.address())
 
 
+@functools.lru_cache(maxsize=64)
+def _type_tag(type_str: str) -> TypeTag:
+    # Type strings are a small fixed set; parse each one once
+    return TypeTag(StructTag.from_str(type_str))
+
+
 async def coin_balance(ctx: Ctx, coin_type: str) -> int:
     return int(await ctx.rest.account_balance(ctx.address, coin_type=coin_type))
 
@@ -76,39 +86,45 @@ async def coin_decimals(ctx: Ctx, coin_type: str) -> int:
     res = await ctx.rest.view_bcs_payload(
         "0x1::coin",
         "decimals",
-        [TypeTag(StructTag.from_str(coin_type))],
+        [_type_tag(coin_type)],
         [],
     )
     return int(res[0])
 
 
+async def coin_decimals_many(ctx: Ctx, coin_types: List[str]) -> List[int]:
+    # Independent view calls; issue them together over the client's pool
+    return list(await asyncio.gather(*(coin_decimals(ctx, t) for t in coin_types)))
+
+
+_POW10 = tuple(10 ** i for i in range(20))
+
+
 def human(amount: int, decimals: int) -> str:
     if decimals <= 0:
         return str(amount)
-    factor = 10 ** decimals
-    integer = amount // factor
-    frac = amount % factor
-    return f"{integer}.{frac:0{decimals}d}"
+    factor = _POW10[decimals] if decimals < len(_POW10) else 10 ** decimals
+    integer, frac = divmod(amount, factor)
+    return f"{integer}.{str(frac).zfill(decimals)}"
+
+
+def swap_entry_function(x_type: str, y_type: str, amount_in: int, min_out: int) -> EntryFunction:
+    # Only the two amounts vary between swaps: reuse the parsed module id and
+    # type tags and pack the u64 arguments directly instead of going through
+    # EntryFunction.natural/TransactionArgument
+    return EntryFunction(
+        _SCRIPTS_MODULE_ID,
+        "swap",
+        [_type_tag(x_type), _type_tag(y_type), _type_tag(CURVE_TYPE)],
+        [_U64.pack(amount_in), _U64.pack(min_out)],
+    )
 
 
 async def swap_scripts(ctx: Ctx, x_type: str, y_type: str, amount_in: int, min_out: int) -> str:
     print(
         f"Calling {SCRIPTS_MODULE}::swap<{x_type}, {y_type}, {CURVE_TYPE}> with amount_in={amount_in}, min_out={min_out}"
     )
-    entry = EntryFunction.natural(
-        SCRIPTS_MODULE,
-        "swap",
-        [
-            TypeTag(StructTag.from_str(x_type)),
-            TypeTag(StructTag.from_str(y_type)),
-            TypeTag(StructTag.from_str(CURVE_TYPE)),
-        ],
-        [
-            TransactionArgument(amount_in, Serializer.u64),
-            TransactionArgument(min_out, Serializer.u64),
-        ],
-    )
-    payload = TransactionPayload(entry)
+    payload = TransactionPayload(swap_entry_function(x_type, y_type, amount_in, min_out))
 
     # Optional simulate to surface errors early
     try:
@@ -145,8 +161,7 @@ async def main():
     ctx = await load_ctx()
     try:
         # Fetch balances and decimals
-        apt_dec = await coin_decimals(ctx, APT_TYPE)
-        usdt_dec = await coin_decimals(ctx, USDT_TYPE)
+        apt_dec, usdt_dec = await coin_decimals_many(ctx, [APT_TYPE, USDT_TYPE])
         apt_bal = await coin_balance(ctx, APT_TYPE)
         usdt_bal = await coin_balance(ctx, USDT_TYPE)
 
@@ -13,10 +13,14 @@ import sys
 import time
 import signal
 import subprocess
-import threading
 from typing import List, Dict
+
+import requests
+
 from network_config import NetworkConfig
 
+LOGS_DIR = "logs"
+
 class MultiServerOrchestrator:
     """Orchestrator for running multiple FOMC servers."""
     
@@ -35,16 +39,19 @@ class MultiServerOrchestrator:
             print("❌ multi_web_api.py not found")
             return False
         
-        # Check if keys directory exists
-        if not os.path.exists("keys"):
+        # Check if keys directory exists, listing it once for the checks below
+        try:
+            with os.scandir("keys") as entries:
+                key_files = {entry.name for entry in entries}
+        except FileNotFoundError:
             print("❌ keys directory not found. Run setup_keys.py first.")
             return False
         
         # Check if each server has its environment file
         for server in self.servers:
-            env_file = f"keys/server_{server['id']}.env"
-            if not os.path.exists(env_file):
-                print(f"❌ Environment file not found: {env_file}")
+            env_name = f"server_{server['id']}.env"
+            if env_name not in key_files:
+                print(f"❌ Environment file not found: keys/{env_name}")
                 return False
         
         print("✅ All prerequisites met")
@@ -57,25 +64,18 @@ class MultiServerOrchestrator:
         
         print(f"🚀 Starting server {server_id} on port {port}...")
         
-        # Start the server process
+        # Start the server process; its output goes straight to a per-server
+        # log file so the orchestrator never has to relay it line by line
+        os.makedirs(LOGS_DIR, exist_ok=True)
+        log_path = os.path.join(LOGS_DIR, f"server_{server_id}.log")
         cmd = [sys.executable, "multi_web_api.py", str(server_id)]
-        process = subprocess.Popen(
-            cmd,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.STDOUT,
-            universal_newlines=True,
-            bufsize=1
-        )
-        
-        # Start a thread to handle output
-        def handle_output():
-            if process.stdout:
-                for line in iter(process.stdout.readline, ''):
-                    if line:
-                        print(f"[Server {server_id}] {line.rstrip()}")
-        
-        output_thread = threading.Thread(target=handle_output, daemon=True)
-        output_thread.start()
+        with open(log_path, "wb", buffering=0) as log_file:
+            process = subprocess.Popen(
+                cmd,
+                stdout=log_file,
+                stderr=subprocess.STDOUT
+            )
+        print(f"📝 Server {server_id} logs: {log_path}")
         
         return process
     
@@ -150,20 +150,19 @@ class MultiServerOrchestrator:
         """Perform health check on all servers."""
         print("🔍 Performing health check...")
         
-        import requests
-        
-        for server in self.servers:
-            url = f"http://{server['host']}:{server['port']}/health"
-            try:
-                response = requests.get(url, timeout=5)
-                if response.status_code == 200:
-                    data = response.json()
-                    status = data.get('status', 'unknown')
-                    print(f"✅ Server {server['id']}: {status}")
-                else:
-                    print(f"❌ Server {server['id']}: HTTP {response.status_code}")
-            except Exception as e:
-                print(f"❌ Server {server['id']}: {str(e)}")
+        with requests.Session() as session:
+            for server in self.servers:
+                url = f"http://{server['host']}:{server['port']}/health"
+                try:
+                    response = session.get(url, timeout=5)
+                    if response.status_code == 200:
+                        data = response.json()
+                        status = data.get('status', 'unknown')
+                        print(f"✅ Server {server['id']}: {status}")
+                    else:
+                        print(f"❌ Server {server['id']}: HTTP {response.status_code}")
+                except Exception as e:
+                    print(f"❌ Server {server['id']}: {str(e)}")
 
 def signal_handler(sig, frame):
     """Handle interrupt signals."""
@@ -7,6 +7,20 @@ import base64
 from typing import Dict, List
 from threshold_signing import generate_threshold_keys, encode_bls_private_key_pem, encode_bls_public_key_pem
 
+try:
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+def write_json_file(path: str, data: Dict):
+    """Write data as 2-space indented JSON, using orjson when it is installed."""
+    if orjson is not None:
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(path, 'w') as f:
+            json.dump(data, f, indent=2)
+
 def create_keys_directory():
     """Create keys directory if it doesn't exist."""
     keys_dir = "keys"
@@ -48,8 +62,7 @@ def save_keys_to_json(private_keys: Dict[int, bytes], public_keys: Dict[int, byt
         f"server_{server_id}": private_key_bytes.hex()
         for server_id, private_key_bytes in private_keys.items()
     }
-    with open(private_keys_json, 'w') as f:
-        json.dump(private_keys_data, f, indent=2)
+    write_json_file(private_keys_json, private_keys_data)
     print(f"Saved private keys to {private_keys_json}")
     
     # Save public keys configuration
@@ -63,8 +76,7 @@ def save_keys_to_json(private_keys: Dict[int, bytes], public_keys: Dict[int, byt
             for server_id, public_key_bytes in public_keys.items()
         }
     }
-    with open(public_keys_json, 'w') as f:
-        json.dump(public_keys_data, f, indent=2)
+    write_json_file(public_keys_json, public_keys_data)
     print(f"Saved public keys configuration to {public_keys_json}")
 
 def create_network_config(num_servers: int = 4):
@@ -82,8 +94,7 @@ def create_network_config(num_servers: int = 4):
         config["servers"].append(server_config)
     
     config_file = "network_config.json"
-    with open(config_file, 'w') as f:
-        json.dump(config, f, indent=2)
+    write_json_file(config_file, config)
     print(f"Created network configuration: {config_file}")
 
 def save_keys_to_pem_files(private_keys: Dict[int, bytes], public_keys: Dict[int, bytes],
@@ -165,6 +165,19 @@ module fomc_rates::interest_rate {
         }
     }
 
+    /// Admin-only: set the BLS public key and record a signed rate movement in a single transaction.
+    /// Equivalent to `set_bls_public_key` followed by `record_interest_rate_movement_v5`.
+    public entry fun set_key_and_record_interest_rate_movement_v5<APT, USDT>(
+        admin: &signer,
+        new_key: vector<u8>,
+        basis_points: u64,
+        is_increase: bool,
+        signature: vector<u8>,
+    ) acquires Config {
+        set_bls_public_key(admin, new_key);
+        record_interest_rate_movement_v5<APT, USDT>(admin, basis_points, is_increase, signature);
+    }
+
     /// DEPRECATED: Kept for ABI compatibility with deployed contracts.
     /// Use record_interest_rate_movement_v4() instead.
     public entry fun record_interest_rate_movement_real_signed<APT, USDT, Curve>(
@@ -118,6 +118,19 @@ module fin_triggers::fomc_interest_rate_dexlyn {
         }
     }
 
+    /// Admin-only: set the BLS public key and record a signed rate movement in a single transaction.
+    /// Equivalent to `set_bls_public_key` followed by `record_interest_rate_movement_dexlyn`.
+    public entry fun set_key_and_record_interest_rate_movement_dexlyn<SUPRA, USDT, Curve>(
+        admin: &signer,
+        new_key: vector<u8>,
+        basis_points: u64,
+        is_increase: bool,
+        signature: vector<u8>,
+    ) acquires Config {
+        set_bls_public_key(admin, new_key);
+        record_interest_rate_movement_dexlyn<SUPRA, USDT, Curve>(admin, basis_points, is_increase, signature);
+    }
+
     /// Derives a canonical message from `basis_points` and `is_increase` for signature verification.
     fun derive_message(basis_points: u64, is_increase: bool): vector<u8> {
         let message = vector::empty<u8>();
@@ -3,10 +3,18 @@
 Test script for the web API.
 """
 
-import requests
-import json
+import asyncio
 
-def test_api():
+import aiohttp
+
+async def _post_extract(session: aiohttp.ClientSession, base_url: str, text: str):
+    """POST one text to /extract and return (status, body)."""
+    async with session.post(f"{base_url}/extract", json={"text": text}) as response:
+        if response.status == 200:
+            return response.status, await response.json()
+        return response.status, await response.text()
+
+async def _run_api_tests():
     """Test the web API with sample text."""
     
     # Test data
@@ -27,35 +35,39 @@ def test_api():
     
     base_url = "http://localhost:8000"
     
-    # Test health endpoint
-    try:
-        response = requests.get(f"{base_url}/health")
-        print(f"Health check: {response.status_code} - {response.json()}")
-    except Exception as e:
-        print(f"Health check failed: {e}")
-        return
-    
-    # Test extract endpoint
-    for test_case in test_cases:
-        print(f"\nTesting: {test_case['name']}")
-        print(f"Text: {test_case['text']}")
-        
+    async with aiohttp.ClientSession() as session:
+        # Test health endpoint
         try:
-            response = requests.post(
-                f"{base_url}/extract",
-                json={"text": test_case["text"]},
-                headers={"Content-Type": "application/json"}
-            )
-            
-            if response.status_code == 200:
-                result = response.json()
-                print(f"✅ Success: Rate change = {result['rate_change']} bps")
-                print(f"   BLS signature: {result['bls_signature'][:20]}...")
-            else:
-                print(f"❌ Error {response.status_code}: {response.text}")
-                
+            async with session.get(f"{base_url}/health") as response:
+                print(f"Health check: {response.status} - {await response.json()}")
         except Exception as e:
-            print(f"❌ Request failed: {e}")
+            print(f"Health check failed: {e}")
+            return
+
+        # Test extract endpoint; all cases are in flight at once
+        outcomes = await asyncio.gather(
+            *[_post_extract(session, base_url, test_case["text"]) for test_case in test_cases],
+            return_exceptions=True
+        )
+
+    for test_case, outcome in zip(test_cases, outcomes):
+        print(f"\nTesting: {test_case['name']}")
+        print(f"Text: {test_case['text']}")
+
+        if isinstance(outcome, Exception):
+            print(f"❌ Request failed: {outcome}")
+            continue
+
+        status, result = outcome
+        if status == 200:
+            print(f"✅ Success: Rate change = {result['rate_change']} bps")
+            print(f"   BLS signature: {result['bls_signature'][:20]}...")
+        else:
+            print(f"❌ Error {status}: {result}")
+
+def test_api():
+    """Test the web API with sample text."""
+    asyncio.run(_run_api_tests())
 
 if __name__ == "__main__":
     test_api()
\ No newline at end of file
@@ -4,8 +4,35 @@ Test BLS compatibility between our threshold signing and the original integratio
 """
 
 from py_ecc.bls.ciphersuites import G2ProofOfPossession as bls
-from threshold_signing import create_bcs_message_for_fomc, sign_bcs_message, verify_signature
+from py_ecc.bls.g2_primitives import G2_to_signature, signature_to_G2
+from py_ecc.optimized_bls12_381 import add, eq, multiply
+from threshold_signing import (
+    batch_lagrange,
+    batch_verify_partials,
+    combine_threshold_signatures,
+    create_bcs_message_for_fomc,
+    generate_threshold_keys,
+    generate_threshold_signatures,
+    lagrange_coefficient,
+    lagrange_combine,
+    multi_scalar_multiply,
+    set_threshold_config,
+    sign_bcs_message,
+    verify_signature,
+    verify_threshold_with_fallback,
+)
 import secrets
+from unittest.mock import patch
+
+import threshold_signing
+
+def _threshold_setup(n=4, t=3):
+    """Generate an n-of-t key set and partial signatures from servers 1..t on a test message."""
+    set_threshold_config(n, t)
+    private_keys, public_keys, group_public_key = generate_threshold_keys()
+    bcs_message = create_bcs_message_for_fomc(25, True)
+    partials = generate_threshold_signatures(private_keys, bcs_message, list(range(1, t + 1)), public_keys)
+    return private_keys, public_keys, group_public_key, bcs_message, partials
 
 def test_single_signature_compatibility():
     """Test that our BLS signing is compatible with py_ecc BLS."""
@@ -49,17 +76,9 @@ def test_single_signature_compatibility():
     # Test direct py_ecc verification for comparison
     print(f"\n=== DIRECT PY_ECC VERIFICATION TEST ===")
     try:
-        # Direct verification using py_ecc with public key point and signature point
+        # SkToPk/Sign return serialized bytes, so this single call covers the bytes-based API too
         direct_verify_result = bls.Verify(public_key_point, bcs_message, py_ecc_signature)
         print(f"Direct py_ecc verification (pubkey_point, message, sig_point): {direct_verify_result}")
-        
-        # Also test with bytes directly (should fail but let's see the error)
-        try:
-            direct_verify_bytes = bls.Verify(public_key_bytes, bcs_message, py_ecc_signature_bytes)
-            print(f"Direct py_ecc verification (pubkey_bytes, message, sig_bytes): {direct_verify_bytes}")
-        except Exception as e2:
-            print(f"Direct py_ecc verification with bytes failed (expected): {e2}")
-        
     except Exception as e:
         print(f"Direct py_ecc verification error: {e}")
     
@@ -69,8 +88,137 @@ def test_single_signature_compatibility():
     
     return our_verify_result and py_ecc_verify_result
 
+def test_fallback_all_shares_valid():
+    """Valid shares pass on the optimistic path without naming any server."""
+    print("=== Testing threshold verification fallback: all shares valid ===")
+    _, public_keys, group_public_key, bcs_message, partials = _threshold_setup()
+    
+    assert verify_threshold_with_fallback(group_public_key, bcs_message, partials, public_keys) == (True, [])
+
+def test_fallback_names_corrupted_share():
+    """A well-formed share signed with the wrong key is isolated by bisection."""
+    print("=== Testing threshold verification fallback: one corrupted share ===")
+    private_keys, public_keys, group_public_key, bcs_message, partials = _threshold_setup()
+    partials[2] = sign_bcs_message(private_keys[4], bcs_message)
+    
+    assert verify_threshold_with_fallback(group_public_key, bcs_message, partials, public_keys) == (False, [2])
+
+def test_fallback_names_undecodable_share():
+    """A share that is not a G2 point fails the combination and is still named."""
+    print("=== Testing threshold verification fallback: one undecodable share ===")
+    _, public_keys, group_public_key, bcs_message, partials = _threshold_setup()
+    partials[3] = b"\xff" * 96
+    
+    assert verify_threshold_with_fallback(group_public_key, bcs_message, partials, public_keys) == (False, [3])
+
+def _combine_in_scalar_domain(private_keys, bcs_message, indices):
+    """Interpolate the key shares at x=0 and sign once (test only: rebuilds the group secret)."""
+    group_secret = lagrange_combine(
+        {server_id: int.from_bytes(private_keys[server_id], 'big') for server_id in indices}
+    )
+    return sign_bcs_message(group_secret, bcs_message)
+
+def test_scalar_domain_combination_matches():
+    """Combining partial signatures equals signing once with the interpolated secret."""
+    print("=== Testing scalar-domain combination against combined partials ===")
+    private_keys, _, group_public_key, bcs_message, partials = _threshold_setup()
+    
+    combined = combine_threshold_signatures(partials)
+    assert _combine_in_scalar_domain(private_keys, bcs_message, list(partials)) == combined
+    assert verify_signature(group_public_key, bcs_message, combined)
+
+def test_batch_verify_rejects_bad_share():
+    """One share over a different message fails the whole batch."""
+    print("=== Testing batch verification with one bad share ===")
+    private_keys, public_keys, _, bcs_message, partials = _threshold_setup()
+    assert batch_verify_partials(public_keys, bcs_message, partials)
+    
+    partials[1] = sign_bcs_message(private_keys[1], create_bcs_message_for_fomc(50, True))
+    assert not batch_verify_partials(public_keys, bcs_message, partials)
+
+def test_batch_verify_rejects_swapped_shares():
+    """Valid shares attributed to the wrong servers fail despite the aggregate matching."""
+    print("=== Testing batch verification with swapped shares ===")
+    _, public_keys, _, bcs_message, partials = _threshold_setup()
+    partials[1], partials[2] = partials[2], partials[1]
+    
+    assert not batch_verify_partials(public_keys, bcs_message, partials)
+
+def test_msm_matches_naive_combination():
+    """The Straus MSM and combine_threshold_signatures agree with per-share multiply/add."""
+    print("=== Testing MSM combination against naive py_ecc combination ===")
+    _, _, _, _, partials = _threshold_setup(n=7, t=5)
+    coeffs = batch_lagrange(list(partials))
+    points = [signature_to_G2(partials[server_id]) for server_id in partials]
+    scalars = [coeffs[server_id] for server_id in partials]
+    
+    naive = multiply(points[0], scalars[0])
+    for point, scalar in zip(points[1:], scalars[1:]):
+        naive = add(naive, multiply(point, scalar))
+    
+    assert eq(multi_scalar_multiply(points, scalars), naive)
+    assert combine_threshold_signatures(partials) == G2_to_signature(naive)
+
+def test_batch_lagrange_matches_direct_coefficients():
+    """Closed-form (servers 1..t) and batched quorum coefficients equal the direct formula."""
+    print("=== Testing Lagrange coefficients ===")
+    quorums = [list(range(1, t + 1)) for t in range(1, 9)] + [[2, 4, 5], [7, 1, 3, 6]]
+    for ids in quorums:
+        assert batch_lagrange(ids) == {i: lagrange_coefficient(i, ids) for i in ids}
+
+def test_installed_backends_match_py_ecc():
+    """Every installed native backend signs byte-identically to py_ecc and agrees on verification."""
+    print("=== Testing installed backends against py_ecc ===")
+    from py_ecc.optimized_bls12_381.optimized_curve import curve_order
+    private_key_scalar = secrets.randbelow(curve_order - 1) + 1
+    private_key_bytes = private_key_scalar.to_bytes(32, 'big')
+    public_key_bytes = bls.SkToPk(private_key_scalar)
+    bcs_message = create_bcs_message_for_fomc(25, True)
+    other_message = create_bcs_message_for_fomc(50, False)
+    reference_signature = bls.Sign(private_key_scalar, bcs_message)
+    
+    # Each backend runs with the others patched out, exactly as if it were the only one installed
+    backends = {
+        "blspy": (threshold_signing.PopSchemeMPL, {"G2Point": None}),
+        "py_arkworks_bls12381": (threshold_signing.G2Point, {"PopSchemeMPL": None}),
+        "pure-Python fallback": (bls, {"PopSchemeMPL": None, "G2Point": None}),
+    }
+    for name, (module, disabled) in backends.items():
+        if module is None:
+            print(f"⏭️  {name} not installed, skipping")
+            continue
+        with patch.multiple(threshold_signing, **disabled):
+            signature = sign_bcs_message(private_key_bytes, bcs_message)
+            assert signature == reference_signature, name
+            assert verify_signature(public_key_bytes, bcs_message, reference_signature), name
+            assert not verify_signature(public_key_bytes, other_message, reference_signature), name
+            
+            _, public_keys, group_public_key, _, partials = _threshold_setup()
+            combined = combine_threshold_signatures(partials)
+            assert bls.Verify(group_public_key, bcs_message, combined), name
+            assert verify_signature(group_public_key, bcs_message, combined), name
+            assert batch_verify_partials(public_keys, bcs_message, partials), name
+        print(f"✅ {name} matches py_ecc")
+    
+    if threshold_signing.gmpy2 is None:
+        print("⏭️  gmpy2 not installed, skipping")
+    else:
+        value = secrets.randbelow(curve_order - 1) + 1
+        assert threshold_signing.mod_inv(value) == pow(value, -1, curve_order)
+        print("✅ gmpy2 matches pow(x, -1, p)")
+
 if __name__ == "__main__":
     success = test_single_signature_compatibility()
+    # The threshold tests assert instead of returning a result
+    test_fallback_all_shares_valid()
+    test_fallback_names_corrupted_share()
+    test_fallback_names_undecodable_share()
+    test_scalar_domain_combination_matches()
+    test_batch_verify_rejects_bad_share()
+    test_batch_verify_rejects_swapped_shares()
+    test_msm_matches_naive_combination()
+    test_batch_lagrange_matches_direct_coefficients()
+    test_installed_backends_match_py_ecc()
     if success:
         print("\n✅ BLS compatibility test PASSED")
     else:
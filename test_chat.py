@@ -6,95 +6,94 @@ import chat
 class TestChatExtraction(unittest.TestCase):
     """Unit tests for chat.py interest rate extraction functionality."""
     
+    @classmethod
+    def setUpClass(cls):
+        """Patch ollama.chat once for the whole class and run the warmup conversation."""
+        patcher = patch.object(chat.ollama, 'chat', autospec=True)
+        # Keep the mock behind the autospec function; storing the function itself
+        # on the class would turn it into a bound method
+        cls.mock_ollama_chat = patcher.start().mock
+        cls.addClassCleanup(patcher.stop)
+        
+        cls.mock_ollama_chat.return_value = {'message': {'content': 'ready'}}
+        cls.warmup_messages = chat.warmup()
+    
     def setUp(self):
         """Set up test fixtures before each test method."""
-        self.messages = chat.warmup()
+        self.mock_ollama_chat.reset_mock()
+        # reset_mock() leaves side_effect on the autospec function in place
+        self.mock_ollama_chat.side_effect = None
+        # extract() appends to the conversation, so give each test its own copy
+        self.messages = list(self.warmup_messages)
+        chat.clear_extract_cache()
     
-    @patch('chat.ollama.chat')
-    def test_rate_increase(self, mock_ollama_chat):
+    @staticmethod
+    def _mock_flow(fed_decision, sentence, direction, basis_points):
+        """Return the ollama.chat side_effect for one structured extraction answer."""
+        payload = {
+            "fed_decision": fed_decision,
+            "sentence": sentence,
+            "direction": direction,
+            "basis_points": basis_points,
+        }
+        return [{'message': {'content': json.dumps(payload)}}]
+    
+    def test_rate_increase(self):
         """Test extraction of interest rate increase."""
-        # Mock responses for the conversation flow
-        mock_responses = [
-            {'message': {'content': 'Yes'}},  # Initial question response
-            {'message': {'content': 'The Federal Reserve raised the federal funds rate by 0.75 percentage points.'}},  # Sentence extraction
-            {'message': {'content': '{"direction": "increase", "basis_points": 75}'}}  # JSON response
-        ]
-        mock_ollama_chat.side_effect = mock_responses
+        self.mock_ollama_chat.side_effect = self._mock_flow('yes', 'The Federal Reserve raised the federal funds rate by 0.75 percentage points.', 'increase', 75)
         
         article_text = "The Federal Reserve announced today that it has raised the federal funds rate by 0.75 percentage points to combat inflation."
         result = chat.extract(article_text, self.messages)
         
         self.assertEqual(result, 75)
-        self.assertEqual(mock_ollama_chat.call_count, 3)
+        self.assertEqual(self.mock_ollama_chat.call_count, 1)
+        self.assertEqual(self.mock_ollama_chat.call_args.kwargs['format'], 'json')
     
-    @patch('chat.ollama.chat')
-    def test_rate_decrease(self, mock_ollama_chat):
+    def test_rate_decrease(self):
         """Test extraction of interest rate decrease."""
-        # Mock responses for the conversation flow
-        mock_responses = [
-            {'message': {'content': 'Yes'}},  # Initial question response
-            {'message': {'content': 'The Federal Reserve cut interest rates by 0.50 percentage points.'}},  # Sentence extraction
-            {'message': {'content': '{"direction": "decrease", "basis_points": 50}'}}  # JSON response
-        ]
-        mock_ollama_chat.side_effect = mock_responses
+        self.mock_ollama_chat.side_effect = self._mock_flow('yes', 'The Federal Reserve cut interest rates by 0.50 percentage points.', 'decrease', 50)
         
         article_text = "In response to economic concerns, the Federal Reserve cut interest rates by 0.50 percentage points today."
         result = chat.extract(article_text, self.messages)
         
         self.assertEqual(result, -50)  # Should be negative for decrease
-        self.assertEqual(mock_ollama_chat.call_count, 3)
+        self.assertEqual(self.mock_ollama_chat.call_count, 1)
     
-    @patch('chat.ollama.chat')
-    def test_rate_maintain(self, mock_ollama_chat):
+    def test_rate_maintain(self):
         """Test extraction when rates are maintained at current levels."""
-        # Mock responses for the conversation flow
-        mock_responses = [
-            {'message': {'content': 'Yes'}},  # Initial question response
-            {'message': {'content': 'The Federal Reserve decided to maintain current interest rates at their existing levels.'}},  # Sentence extraction
-            {'message': {'content': '{"direction": "maintain", "basis_points": 0}'}}  # JSON response
-        ]
-        mock_ollama_chat.side_effect = mock_responses
+        self.mock_ollama_chat.side_effect = self._mock_flow('yes', 'The Federal Reserve decided to maintain current interest rates at their existing levels.', 'maintain', 0)
         
         article_text = "The Federal Reserve decided to maintain current interest rates at their existing levels, citing stable economic conditions."
         result = chat.extract(article_text, self.messages)
         
         self.assertEqual(result, 0)
-        self.assertEqual(mock_ollama_chat.call_count, 3)
+        self.assertEqual(self.mock_ollama_chat.call_count, 1)
     
-    @patch('chat.ollama.chat')
-    def test_no_fed_decision(self, mock_ollama_chat):
+    def test_no_fed_decision(self):
         """Test when there's no Federal Reserve decision about interest rates."""
-        # Mock response indicating no FED decision
-        mock_responses = [
-            {'message': {'content': 'No'}}  # Initial question response - no FED decision
-        ]
-        mock_ollama_chat.side_effect = mock_responses
+        self.mock_ollama_chat.side_effect = self._mock_flow('no', '', 'maintain', 0)
         
         article_text = "This is a general economic report discussing market trends and inflation data without any Federal Reserve interest rate decision."
         result = chat.extract(article_text, self.messages)
         
         self.assertIsNone(result)
-        self.assertEqual(mock_ollama_chat.call_count, 1)  # Should stop after first response
+        self.assertEqual(self.mock_ollama_chat.call_count, 1)
     
-    @patch('chat.ollama.chat')
-    def test_json_parsing_error(self, mock_ollama_chat):
+    def test_json_parsing_error(self):
         """Test handling of JSON parsing errors."""
         # Mock responses with invalid JSON
         mock_responses = [
-            {'message': {'content': 'Yes'}},  # Initial question response
-            {'message': {'content': 'The Federal Reserve raised rates by 0.25 percentage points.'}},  # Sentence extraction
-            {'message': {'content': 'Invalid JSON response that cannot be parsed'}}  # Invalid JSON
+            {'message': {'content': 'Invalid JSON response that cannot be parsed'}}
         ]
-        mock_ollama_chat.side_effect = mock_responses
+        self.mock_ollama_chat.side_effect = mock_responses
         
         article_text = "The Federal Reserve raised rates by 0.25 percentage points."
         result = chat.extract(article_text, self.messages)
         
         self.assertIsNone(result)  # Should return None on parsing error
-        self.assertEqual(mock_ollama_chat.call_count, 3)
+        self.assertEqual(self.mock_ollama_chat.call_count, 1)
     
-    @patch('chat.ollama.chat')
-    def test_empty_article_text(self, mock_ollama_chat):
+    def test_empty_article_text(self):
         """Test handling of empty or None article text."""
         result = chat.extract(None, self.messages)
         self.assertIsNone(result)
@@ -103,24 +102,50 @@ class TestChatExtraction(unittest.TestCase):
         self.assertIsNone(result)
         
         # Should not call ollama.chat for empty input
-        mock_ollama_chat.assert_not_called()
+        self.mock_ollama_chat.assert_not_called()
     
-    @patch('chat.ollama.chat')
-    def test_rate_maintain_alternative_phrasing(self, mock_ollama_chat):
+    def test_whitespace_article_text(self):
+        """Test that whitespace-only article text is treated as empty."""
+        result = chat.extract("   \n", self.messages)
+        self.assertIsNone(result)
+        
+        self.mock_ollama_chat.assert_not_called()
+    
+    def test_rate_maintain_alternative_phrasing(self):
         """Test different phrasings for maintaining rates."""
-        # Mock responses for the conversation flow
-        mock_responses = [
-            {'message': {'content': 'Yes'}},  # Initial question response
-            {'message': {'content': 'The Committee decided to keep the target range unchanged.'}},  # Sentence extraction
-            {'message': {'content': '{"direction": "maintain", "basis_points": 0}'}}  # JSON response
-        ]
-        mock_ollama_chat.side_effect = mock_responses
+        self.mock_ollama_chat.side_effect = self._mock_flow('yes', 'The Committee decided to keep the target range unchanged.', 'maintain', 0)
         
         article_text = "The FOMC Committee decided to keep the target range for the federal funds rate unchanged at 5.25 to 5.50 percent."
         result = chat.extract(article_text, self.messages)
         
         self.assertEqual(result, 0)
-        self.assertEqual(mock_ollama_chat.call_count, 3)
+        self.assertEqual(self.mock_ollama_chat.call_count, 1)
+
+    def test_repeated_article_uses_cache(self):
+        """Test that extracting the same article twice only queries the model once."""
+        self.mock_ollama_chat.side_effect = self._mock_flow('yes', 'The Federal Reserve cut interest rates by 0.25 percentage points.', 'decrease', 25)
+        
+        article_text = "The Federal Reserve cut interest rates by 0.25 percentage points."
+        first = chat.extract(article_text, self.messages)
+        second = chat.extract(article_text, list(self.warmup_messages))
+        
+        self.assertEqual(first, -25)
+        self.assertEqual(second, -25)
+        self.assertEqual(self.mock_ollama_chat.call_count, 1)
+    
+    def test_cached_article_without_ollama(self):
+        """Test that a cached article is answered even when the daemon is unreachable."""
+        self.mock_ollama_chat.side_effect = self._mock_flow('yes', 'The Federal Reserve raised interest rates by 25 basis points.', 'increase', 25)
+        
+        article_text = "The Federal Reserve raised interest rates by 25 basis points."
+        chat.extract(article_text, self.messages)
+        with patch.object(chat, 'is_ollama_available', return_value=False):
+            result = chat.extract(article_text, list(self.warmup_messages))
+            with self.assertRaises(chat.OllamaUnavailableError):
+                chat.extract("An article the cache has not seen.", list(self.warmup_messages))
+        
+        self.assertEqual(result, 25)
+        self.assertEqual(self.mock_ollama_chat.call_count, 1)
 
 class TestChatWarmup(unittest.TestCase):
     """Unit tests for chat warmup functionality."""
@@ -137,6 +162,19 @@ class TestChatWarmup(unittest.TestCase):
         self.assertEqual(messages[0]['role'], 'user')
         self.assertEqual(messages[1]['role'], 'assistant')
         self.assertIn('Federal Reserve decision about interest rates', messages[0]['content'])
+    
+    @patch('chat.ollama.chat')
+    def test_get_warmup_runs_prompt_once(self, mock_ollama_chat):
+        """Test that get_warmup caches the conversation and hands out copies."""
+        mock_ollama_chat.return_value = {'message': {'content': 'Ready to analyze FOMC statements.'}}
+        
+        with patch.object(chat, '_warmup_messages', None):
+            first = chat.get_warmup()
+            first.append({'role': 'user', 'content': 'statement'})
+            second = chat.get_warmup()
+        
+        self.assertEqual(mock_ollama_chat.call_count, 1)
+        self.assertEqual(len(second), 2)
 
 if __name__ == '__main__':
     # Run the tests
@@ -12,77 +12,174 @@ This script tests that all 4 servers:
 
 import asyncio
 import json
+import sys
 import time
+from collections import Counter
+from itertools import islice
 from typing import Dict, List, Optional
-import requests
+import aiohttp
+
+try:
+    import orjson  # type: ignore
+except ImportError:
+    orjson = None
+
+from env_utils import bool_env
 from network_config import NetworkConfig
 from threshold_signing import (
-    generate_threshold_signatures,
-    combine_threshold_signatures,
-    verify_signature,
+    sign_bcs_message,
+    verify_threshold_with_fallback,
     create_bcs_message_for_fomc
 )
 
+# FAST_TESTS=1 replaces every network call with locally generated server responses,
+# so the analysis and signature-combination logic runs without servers or an LLM
+FAST_TESTS = bool_env("FAST_TESTS")
+
+# orjson.JSONDecodeError subclasses ValueError, like json.JSONDecodeError
+_json_loads = orjson.loads if orjson is not None else json.loads
+
 class MultiServerTester:
     """Tester for FOMC multi-server threshold signing setup."""
     
     def __init__(self):
         self.network_config = NetworkConfig()
-        self.servers = self.network_config.get_servers_config()
-        self.base_urls = [
+        # Server list and URLs are fixed for the tester's lifetime
+        self.servers = tuple(self.network_config.get_servers_config())
+        self.base_urls = tuple(
             f"http://{server['host']}:{server['port']}" 
             for server in self.servers
-        ]
+        )
+        # One event loop and one pooled session serve every request, so
+        # keep-alive connections are reused across the whole test run
+        self._loop = asyncio.new_event_loop()
+        self._session: Optional[aiohttp.ClientSession] = None
+        # Public keys are read once; they are absent until setup_keys.py has run
+        try:
+            with open("keys/bls_public_keys.json", 'r') as f:
+                public_keys = json.load(f)
+            self._group_public_key: Optional[bytes] = bytes.fromhex(public_keys["group_public_key"])
+            self._server_public_keys: Dict[int, bytes] = {
+                int(name.removeprefix("server_")): bytes.fromhex(key_hex)
+                for name, key_hex in public_keys.get("server_public_keys", {}).items()
+            }
+        except FileNotFoundError:
+            self._group_public_key = None
+            self._server_public_keys = {}
+    
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Return the shared HTTP session, creating it on first use (inside the loop)."""
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(limit=16, limit_per_host=8)
+            self._session = aiohttp.ClientSession(connector=connector)
+        return self._session
+    
+    def close(self):
+        """Close the shared HTTP session and the event loop."""
+        if self._session is not None and not self._session.closed:
+            self._loop.run_until_complete(self._session.close())
+        self._loop.close()
     
     def test_server_health(self) -> Dict[int, bool]:
         """Test health of all servers."""
         print("🔍 Testing server health...")
-        results = {}
+        if FAST_TESTS:
+            print("⏩ FAST_TESTS set - skipping server health check")
+            return {i: True for i in range(1, len(self.base_urls) + 1)}
+        results = self._loop.run_until_complete(self._test_server_health())
         
-        for i, base_url in enumerate(self.base_urls, 1):
-            try:
-                response = requests.get(f"{base_url}/health", timeout=5)
-                if response.status_code == 200:
-                    data = response.json()
+        healthy_count = sum(results.values())
+        print(f"\n📊 Health Summary: {healthy_count}/4 servers healthy")
+        return results
+    
+    async def _test_server_health(self) -> Dict[int, bool]:
+        """Query every server's /health endpoint concurrently."""
+        session = self._get_session()
+        healthy = await asyncio.gather(*[
+            self._check_health(session, i, base_url)
+            for i, base_url in enumerate(self.base_urls, 1)
+        ])
+        return dict(enumerate(healthy, 1))
+    
+    async def _check_health(self, session: aiohttp.ClientSession, i: int, base_url: str) -> bool:
+        """Check a single server's health."""
+        try:
+            async with session.get(f"{base_url}/health", timeout=aiohttp.ClientTimeout(total=5)) as response:
+                if response.status == 200:
+                    data = await response.json()
                     if data.get('status') == 'healthy':
                         print(f"✅ Server {i}: Healthy")
-                        results[i] = True
+                        return True
+                    print(f"❌ Server {i}: Unhealthy - {data.get('error', 'Unknown error')}")
+                    return False
+                print(f"❌ Server {i}: HTTP {response.status}")
+                return False
+        except Exception as e:
+            print(f"❌ Server {i}: Connection failed - {str(e)}")
+            return False
+    
+    def _warmup_all_servers(self):
+        """Ask every server to load its LLM before any extraction is timed."""
+        if FAST_TESTS:
+            return
+        print("\n🔥 Warming up LLM on all servers...")
+        self._loop.run_until_complete(self._warmup_servers())
+    
+    async def _warmup_servers(self):
+        """POST /warmup to every server concurrently and wait for all of them."""
+        async def post(i: int, base_url: str):
+            try:
+                async with session.post(
+                    f"{base_url}/warmup",
+                    timeout=aiohttp.ClientTimeout(total=120)
+                ) as response:
+                    if response.status == 200:
+                        status = (await response.json()).get('status', 'unknown')
+                        print(f"{'✅' if status == 'warm' else '⚠️'} Server {i}: Warmup {status}")
                     else:
-                        print(f"❌ Server {i}: Unhealthy - {data.get('error', 'Unknown error')}")
-                        results[i] = False
-                else:
-                    print(f"❌ Server {i}: HTTP {response.status_code}")
-                    results[i] = False
+                        print(f"⚠️ Server {i}: Warmup HTTP {response.status}")
             except Exception as e:
-                print(f"❌ Server {i}: Connection failed - {str(e)}")
-                results[i] = False
+                print(f"⚠️ Server {i}: Warmup failed - {str(e)}")
         
-        healthy_count = sum(results.values())
-        print(f"\n📊 Health Summary: {healthy_count}/4 servers healthy")
-        return results
+        session = self._get_session()
+        await asyncio.gather(*[post(i, base_url) for i, base_url in enumerate(self.base_urls, 1)])
     
     def test_rate_extraction(self, text: str, expected_rate: Optional[int] = None) -> Dict[int, Dict]:
         """Test rate extraction and threshold signing on all servers with the same input."""
         print(f"\n🧪 Testing rate extraction and threshold signing with text: '{text[:50]}...'")
-        results = {}
-        
-        for i, base_url in enumerate(self.base_urls, 1):
-            try:
-                response = requests.post(
-                    f"{base_url}/extract",
-                    json={"text": text},
-                    timeout=30
-                )
-                
-                if response.status_code == 200:
-                    data = response.json()
+        if FAST_TESTS:
+            return self._fake_extract_results(expected_rate)
+        return self._loop.run_until_complete(self._test_rate_extraction(text, expected_rate))
+    
+    async def _test_rate_extraction(self, text: str, expected_rate: Optional[int]) -> Dict[int, Dict]:
+        """POST the same text to every server concurrently."""
+        session = self._get_session()
+        responses = await asyncio.gather(*[
+            self._extract(session, i, base_url, text, expected_rate)
+            for i, base_url in enumerate(self.base_urls, 1)
+        ])
+        return dict(enumerate(responses, 1))
+    
+    async def _extract(self, session: aiohttp.ClientSession, i: int, base_url: str,
+                       text: str, expected_rate: Optional[int]) -> Dict:
+        """Run rate extraction and threshold signing on a single server."""
+        try:
+            async with session.post(
+                f"{base_url}/extract",
+                json={"text": text},
+                timeout=aiohttp.ClientTimeout(total=30)
+            ) as response:
+                # Read the body once and decode it ourselves for both branches
+                body = await response.read()
+                if response.status == 200:
+                    data = _json_loads(body)
                     rate_change = data.get('rate_change')
                     threshold_signature = data.get('bls_threshold_signature')
                     server_id = data.get('server_id')
                     abs_bps = data.get('abs_bps')
                     is_increase = data.get('is_increase')
                     
-                    results[i] = {
+                    result = {
                         'success': True,
                         'rate_change': rate_change,
                         'threshold_signature': threshold_signature,
@@ -93,22 +190,55 @@ class MultiServerTester:
                     
                     status = "✅" if expected_rate is None or rate_change == expected_rate else "⚠️"
                     print(f"{status} Server {i}: Rate={rate_change}bp, ThresholdSig={threshold_signature[:16]}...")
-                    
-                else:
-                    error_msg = response.json().get('detail', 'Unknown error') if response.headers.get('content-type', '').startswith('application/json') else response.text
-                    results[i] = {
-                        'success': False,
-                        'error': f"HTTP {response.status_code}: {error_msg}"
-                    }
-                    print(f"❌ Server {i}: {results[i]['error']}")
-                    
-            except Exception as e:
-                results[i] = {
+                    return result
+                
+                try:
+                    error_body = _json_loads(body)
+                    error_msg = error_body.get('detail', 'Unknown error') if isinstance(error_body, dict) else error_body
+                except ValueError:
+                    error_msg = body.decode('utf-8', errors='replace')
+                result = {
                     'success': False,
-                    'error': str(e)
+                    'error': f"HTTP {response.status}: {error_msg}"
                 }
-                print(f"❌ Server {i}: {str(e)}")
+                print(f"❌ Server {i}: {result['error']}")
+                return result
+                
+        except Exception as e:
+            print(f"❌ Server {i}: {str(e)}")
+            return {
+                'success': False,
+                'error': str(e)
+            }
+    
+    def _fake_extract_results(self, expected_rate: Optional[int]) -> Dict[int, Dict]:
+        """Build the responses the servers would return, signed with the local key shares."""
+        rate_change = expected_rate if expected_rate is not None else 0
+        abs_bps = abs(rate_change)
+        is_increase = rate_change > 0
+        bcs_message = create_bcs_message_for_fomc(abs_bps, is_increase)
+        
+        try:
+            with open("keys/bls_private_keys.json", 'r') as f:
+                private_keys = json.load(f)
+        except FileNotFoundError:
+            error = "keys/bls_private_keys.json not found. Please run setup_keys.py first."
+            print(f"❌ {error}")
+            return {i: {'success': False, 'error': error} for i in range(1, len(self.base_urls) + 1)}
         
+        results = {}
+        for i in range(1, len(self.base_urls) + 1):
+            private_key = bytes.fromhex(private_keys[f"server_{i}"].lower().removeprefix("0x"))
+            threshold_signature = sign_bcs_message(private_key, bcs_message).hex()
+            results[i] = {
+                'success': True,
+                'rate_change': rate_change,
+                'threshold_signature': threshold_signature,
+                'server_id': i,
+                'abs_bps': abs_bps,
+                'is_increase': is_increase
+            }
+            print(f"✅ Server {i}: Rate={rate_change}bp, ThresholdSig={threshold_signature[:16]}... (fake)")
         return results
     
     def analyze_consistency(self, results: Dict[int, Dict]) -> Dict:
@@ -118,17 +248,17 @@ class MultiServerTester:
         if not successful_results:
             return {'consistent': False, 'reason': 'No successful responses'}
         
-        # Check rate change consistency
-        rate_changes = [r['rate_change'] for r in successful_results.values()]
-        rate_consistent = len(set(rate_changes)) == 1
+        # Collect every compared field in a single pass over the responses
+        rate_changes, threshold_signatures, abs_bps_values, is_increase_values = (
+            list(column) for column in zip(*(
+                (r['rate_change'], r['threshold_signature'], r.get('abs_bps'), r.get('is_increase'))
+                for r in successful_results.values()
+            ))
+        )
         
-        # Check threshold signature uniqueness (they should be different)
-        threshold_signatures = [r['threshold_signature'] for r in successful_results.values()]
+        # Rate change, abs_bps and is_increase must agree; threshold signatures must all differ
+        rate_consistent = len(set(rate_changes)) == 1
         signatures_unique = len(set(threshold_signatures)) == len(threshold_signatures)
-        
-        # Check abs_bps and is_increase consistency
-        abs_bps_values = [r.get('abs_bps') for r in successful_results.values()]
-        is_increase_values = [r.get('is_increase') for r in successful_results.values()]
         abs_bps_consistent = len(set(abs_bps_values)) == 1
         is_increase_consistent = len(set(is_increase_values)) == 1
         
@@ -155,13 +285,11 @@ class MultiServerTester:
         
         print(f"\n🔗 Testing threshold signature combination...")
         
+        if self._group_public_key is None:
+            print("❌ keys/bls_public_keys.json not found. Please run setup_keys.py first.")
+            return False
+        
         try:
-            # Load group public key
-            import json
-            with open("keys/bls_public_keys.json", 'r') as f:
-                config = json.load(f)
-            group_public_key = bytes.fromhex(config["group_public_key"])
-            
             # Get first successful result to extract common data
             first_result = next(iter(successful_results.values()))
             abs_bps = first_result.get('abs_bps')
@@ -175,34 +303,29 @@ class MultiServerTester:
             bcs_message = create_bcs_message_for_fomc(abs_bps, is_increase)
             
             # Test different combinations of 3 servers
-            server_ids = list(successful_results.keys())[:3]  # Take first 3 successful servers
+            server_ids = list(islice(successful_results, 3))  # Take first 3 successful servers
             print(f"Testing threshold signature combination with servers: {server_ids}")
             
-            # Simulate threshold signature combination
-            # Note: In real implementation, this would be done by an aggregator
-            # Here we just verify that each individual signature is valid for its server
+            partial_signatures = {
+                server_id: bytes.fromhex(successful_results[server_id]['threshold_signature'])
+                for server_id in server_ids
+            }
+            
+            # One combination and one pairing check against the group key on the happy
+            # path; only on failure are the partials bisected to name the bad shares
+            success, bad_servers = verify_threshold_with_fallback(
+                self._group_public_key, bcs_message, partial_signatures, self._server_public_keys
+            )
             
-            valid_signatures = 0
+            if not success:
+                print("❌ Combined signature does not verify against the group public key")
             for server_id in server_ids:
-                result = successful_results[server_id]
-                threshold_sig = result['threshold_signature']
-                
-                # For now, just count that we have valid threshold signatures
-                # In a full implementation, we would:
-                # 1. Load each server's public key
-                # 2. Verify each threshold signature
-                # 3. Combine them using Lagrange coefficients
-                # 4. Verify the combined signature against group public key
-                
-                if threshold_sig and len(threshold_sig) > 0:
-                    valid_signatures += 1
-                    print(f"✅ Server {server_id}: Valid threshold signature")
-                else:
+                if server_id in bad_servers:
                     print(f"❌ Server {server_id}: Invalid threshold signature")
+                else:
+                    print(f"✅ Server {server_id}: Valid threshold signature")
             
-            success = valid_signatures >= 3
             print(f"Threshold signature combination test: {'SUCCESS' if success else 'FAILED'}")
-            print(f"Valid threshold signatures: {valid_signatures}/3")
             
             return success
             
@@ -210,8 +333,12 @@ class MultiServerTester:
             print(f"❌ Threshold signature combination test failed: {e}")
             return False
 
-    def run_comprehensive_test(self):
-        """Run comprehensive test suite."""
+    def run_comprehensive_test(self, fail_fast: bool = True):
+        """Run comprehensive test suite.
+        
+        With fail_fast, the remaining scenarios are skipped after the first failure;
+        pass fail_fast=False for the full diagnostic report.
+        """
         print("=" * 70)
         print("🧪 FOMC MULTI-SERVER THRESHOLD SIGNING COMPREHENSIVE TEST")
         print("=" * 70)
@@ -222,75 +349,58 @@ class MultiServerTester:
             print("\n❌ Not all servers are healthy. Please check server status.")
             return False
         
-        # Test 2: Rate increase detection
-        print("\n" + "=" * 50)
-        print("📈 TEST: Rate Increase Detection")
-        print("=" * 50)
-        
-        increase_text = "The Federal Reserve announced a 25 basis point increase in the federal funds rate to combat inflation."
-        increase_results = self.test_rate_extraction(increase_text, 25)
-        increase_analysis = self.analyze_consistency(increase_results)
-        
-        print(f"\n📊 Analysis: {increase_analysis['successful_servers']}/4 servers responded")
-        print(f"Rate consistency: {'✅' if increase_analysis['rate_consistent'] else '❌'}")
-        print(f"Threshold signature uniqueness: {'✅' if increase_analysis['signatures_unique'] else '❌'}")
-        print(f"abs_bps consistency: {'✅' if increase_analysis['abs_bps_consistent'] else '❌'}")
-        print(f"is_increase consistency: {'✅' if increase_analysis['is_increase_consistent'] else '❌'}")
-        
-        # Test threshold signature combination
-        threshold_increase_success = self.test_threshold_signature_combination(increase_results)
-        
-        # Test 3: Rate decrease detection
-        print("\n" + "=" * 50)
-        print("📉 TEST: Rate Decrease Detection")
-        print("=" * 50)
-        
-        decrease_text = "The Fed cut interest rates by 50 basis points in response to economic concerns."
-        decrease_results = self.test_rate_extraction(decrease_text, -50)
-        decrease_analysis = self.analyze_consistency(decrease_results)
-        
-        print(f"\n📊 Analysis: {decrease_analysis['successful_servers']}/4 servers responded")
-        print(f"Rate consistency: {'✅' if decrease_analysis['rate_consistent'] else '❌'}")
-        print(f"Threshold signature uniqueness: {'✅' if decrease_analysis['signatures_unique'] else '❌'}")
-        print(f"abs_bps consistency: {'✅' if decrease_analysis['abs_bps_consistent'] else '❌'}")
-        print(f"is_increase consistency: {'✅' if decrease_analysis['is_increase_consistent'] else '❌'}")
-        
-        # Test threshold signature combination
-        threshold_decrease_success = self.test_threshold_signature_combination(decrease_results)
-        
-        # Test 4: No rate change detection
-        print("\n" + "=" * 50)
-        print("🔄 TEST: No Rate Change Detection")
-        print("=" * 50)
-        
-        no_change_text = "The Federal Reserve decided to maintain the current interest rate level."
-        no_change_results = self.test_rate_extraction(no_change_text, 0)
-        no_change_analysis = self.analyze_consistency(no_change_results)
-        
-        print(f"\n📊 Analysis: {no_change_analysis['successful_servers']}/4 servers responded")
-        print(f"Rate consistency: {'✅' if no_change_analysis['rate_consistent'] else '❌'}")
-        print(f"Threshold signature uniqueness: {'✅' if no_change_analysis['signatures_unique'] else '❌'}")
-        print(f"abs_bps consistency: {'✅' if no_change_analysis['abs_bps_consistent'] else '❌'}")
-        print(f"is_increase consistency: {'✅' if no_change_analysis['is_increase_consistent'] else '❌'}")
+        # Load the model everywhere before the timed extraction tests
+        self._warmup_all_servers()
+        
+        # Tests 2-4: (emoji, title, label, text, expected rate change)
+        scenarios = [
+            ("📈", "Rate Increase Detection", "rate increase",
+             "The Federal Reserve announced a 25 basis point increase in the federal funds rate to combat inflation.", 25),
+            ("📉", "Rate Decrease Detection", "rate decrease",
+             "The Fed cut interest rates by 50 basis points in response to economic concerns.", -50),
+            ("🔄", "No Rate Change Detection", "no rate change",
+             "The Federal Reserve decided to maintain the current interest rate level.", 0),
+        ]
         
-        # Test threshold signature combination
-        threshold_no_change_success = self.test_threshold_signature_combination(no_change_results)
+        failures = []
+        for emoji, title, label, text, expected_rate in scenarios:
+            print("\n" + "=" * 50)
+            print(f"{emoji} TEST: {title}")
+            print("=" * 50)
+            
+            results = self.test_rate_extraction(text, expected_rate)
+            analysis = self.analyze_consistency(results)
+            
+            print(f"\n📊 Analysis: {analysis['successful_servers']}/4 servers responded")
+            print(f"Rate consistency: {'✅' if analysis['rate_consistent'] else '❌'}")
+            print(f"Threshold signature uniqueness: {'✅' if analysis['signatures_unique'] else '❌'}")
+            print(f"abs_bps consistency: {'✅' if analysis['abs_bps_consistent'] else '❌'}")
+            print(f"is_increase consistency: {'✅' if analysis['is_increase_consistent'] else '❌'}")
+            
+            if not analysis['consistent']:
+                failures.append(f"{label.capitalize()} test failed")
+                if fail_fast:
+                    break
+            
+            # Test threshold signature combination
+            if not self.test_threshold_signature_combination(results):
+                failures.append(f"Threshold signature combination test failed for {label}")
+                if fail_fast:
+                    break
         
         # Overall results
         print("\n" + "=" * 70)
         print("📋 OVERALL TEST RESULTS")
         print("=" * 70)
         
-        all_tests_passed = (
-            increase_analysis['consistent'] and
-            decrease_analysis['consistent'] and
-            no_change_analysis['consistent'] and
-            threshold_increase_success and
-            threshold_decrease_success and
-            threshold_no_change_success
-        )
+        all_tests_passed = not failures
         
-        if all_tests_passed:
+        if all_tests_passed and FAST_TESTS:
+            print("🎉 ALL THRESHOLD SIGNING TESTS PASSED (FAST_TESTS)")
+            print("⏩ Server extraction and signing were stubbed with locally generated responses")
+            print("✅ Result analysis and threshold signature combination logic work correctly")
+            print("\nℹ️  Run without FAST_TESTS against live servers to check the deployment")
+        elif all_tests_passed:
             print("🎉 ALL THRESHOLD SIGNING TESTS PASSED!")
             print("✅ All servers are working correctly")
             print("✅ Rate extraction is consistent across servers")
@@ -300,57 +410,73 @@ class MultiServerTester:
             print("\n🚀 Multi-server threshold signing setup is ready for production!")
         else:
             print("❌ SOME TESTS FAILED")
-            if not increase_analysis['consistent']:
-                print("❌ Rate increase test failed")
-            if not decrease_analysis['consistent']:
-                print("❌ Rate decrease test failed")
-            if not no_change_analysis['consistent']:
-                print("❌ No rate change test failed")
-            if not threshold_increase_success:
-                print("❌ Threshold signature combination test failed for rate increase")
-            if not threshold_decrease_success:
-                print("❌ Threshold signature combination test failed for rate decrease")
-            if not threshold_no_change_success:
-                print("❌ Threshold signature combination test failed for no rate change")
+            for failure in failures:
+                print(f"❌ {failure}")
+            if fail_fast:
+                print("⏭️  Stopped at the first failure; run with --full for the complete report")
         
         return all_tests_passed
     
     def test_load_balancing(self, num_requests: int = 10):
         """Test load balancing by sending multiple requests."""
+        if FAST_TESTS:
+            print("\n⏩ FAST_TESTS set - skipping load balancing test")
+            return
         print(f"\n🔄 Testing load balancing with {num_requests} requests...")
         
         test_text = "The Fed raised rates by 25 basis points."
-        server_counts = {i: 0 for i in range(1, 5)}
+        server_counts = self._loop.run_until_complete(self._test_load_balancing(test_text, num_requests))
         
-        for _ in range(num_requests):
-            # Round-robin through servers
-            for i, base_url in enumerate(self.base_urls, 1):
+        print("📊 Load distribution:")
+        for server_id in range(1, 5):
+            print(f"  Server {server_id}: {server_counts[server_id]} successful requests")
+    
+    async def _test_load_balancing(self, test_text: str, num_requests: int) -> Counter:
+        """Send num_requests to every server concurrently and count the successes per server."""
+        # At most 16 requests are in flight; the rest wait here rather than in the
+        # connector queue, so the 10s timeout only covers the request itself
+        in_flight = asyncio.Semaphore(16)
+        
+        async def post(session: aiohttp.ClientSession, i: int, base_url: str) -> Optional[int]:
+            async with in_flight:
                 try:
-                    response = requests.post(
+                    async with session.post(
                         f"{base_url}/extract",
                         json={"text": test_text},
-                        timeout=10
-                    )
-                    if response.status_code == 200:
-                        server_counts[i] += 1
-                except:
-                    pass
-        
-        print("📊 Load distribution:")
-        for server_id, count in server_counts.items():
-            print(f"  Server {server_id}: {count} successful requests")
+                        timeout=aiohttp.ClientTimeout(total=10)
+                    ) as response:
+                        return i if response.status == 200 else None
+                except Exception:
+                    return None
+        
+        session = self._get_session()
+        outcomes = await asyncio.gather(*[
+            post(session, i, base_url)
+            for _ in range(num_requests)
+            for i, base_url in enumerate(self.base_urls, 1)
+        ])
+        return Counter(i for i in outcomes if i is not None)
 
 def main():
     """Main test function."""
     tester = MultiServerTester()
     
-    # Run comprehensive tests
-    success = tester.run_comprehensive_test()
+    # --full keeps going after a failing scenario to report every problem
+    full_report = "--full" in sys.argv[1:]
     
-    # Run load balancing test
-    tester.test_load_balancing()
+    try:
+        # Run comprehensive tests
+        success = tester.run_comprehensive_test(fail_fast=not full_report)
+        
+        # Run load balancing test
+        tester.test_load_balancing()
+    finally:
+        tester.close()
     
-    if success:
+    if success and FAST_TESTS:
+        print("\n🎯 Threshold signing logic passed against stubbed servers (FAST_TESTS)")
+        return 0
+    elif success:
         print("\n🎯 Multi-server threshold signing implementation is working correctly!")
         return 0
     else:
@@ -22,6 +22,8 @@ Environment variables used (optional):
 - SUPRA_FROM_TYPE, SUPRA_TO_TYPE, SUPRA_CURVE_TYPE: Override type arguments
 - SUPRA_SKIP_SET_KEY: If truthy, always skip set_bls_public_key
 - SUPRA_SET_KEY: If truthy, override defaults and call set_bls_public_key
+- SUPRA_COMBINED_SET_KEY: If truthy, set the key and record the movement in one
+  transaction (needs the republished module with set_key_and_record_interest_rate_movement_dexlyn)
 - SUPRA_KEYS_DIR: Directory containing saved threshold keys (default "keys")
 - SUPRA_FRESH_KEYS: If truthy, generate new threshold keys for this run
 
@@ -33,32 +35,26 @@ Requirements:
 from __future__ import annotations
 
 import argparse
+import functools
 import json
 import math
 import os
+import selectors
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Optional, Sequence, Tuple, Union
 
-from chat import (
-    OllamaUnavailableError,
-    extract,
-    get_article_text,
-    is_ollama_available,
-    warmup,
-)
-from find_rate_reduction import find_rate_reduction
-from threshold_signing import (
-    combine_threshold_signatures,
-    create_bcs_message_for_fomc,
-    generate_threshold_keys,
-    generate_threshold_signatures,
-    get_n,
-    get_t,
-    set_threshold_config,
-    verify_signature,
-)
+from env_utils import bool_env
+
+try:
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+# chat (Ollama client) and threshold_signing (py-ecc) are imported inside the
+# functions that use them so `--help` and argument errors return immediately.
 
 DEFAULT_CLI_PATH = os.path.expanduser("~/Documents/foundation-multisig-tools/supra")
 DEFAULT_KEYS_DIR = os.environ.get("SUPRA_KEYS_DIR", "keys")
@@ -67,18 +63,24 @@ BASE_CONTRACT_ADDRESS = "0xb993b8afb07eadc713990f90ec5c422e664c13741dc0e932916a9
 BASE_FROM_TYPE = "0x1::supra_coin::SupraCoin"
 BASE_TO_TYPE = "0x6d5684c3585eada2673a7ac9efca870f384fe332c53d0efe8d90f94c59feb164::coins::USDT"
 BASE_CURVE_TYPE = "0x4496a672452b0bf5eff5e1616ebfaf7695e14b02a12ed211dd4f28ac38a5d54c::curves::Uncorrelated"
+_URL_PREFIXES = ("http://", "https://")
 
 
+# The getters below read the environment once and cache the result, so load_dotenv()
+# must run before the first call (main() does this before parsing arguments).
+@functools.lru_cache(maxsize=1)
 def get_cli_profile_default() -> str:
     """Return the Supra CLI profile, considering environment overrides."""
     return os.environ.get("SUPRA_PROFILE", BASE_PROFILE)
 
 
+@functools.lru_cache(maxsize=1)
 def get_contract_address() -> str:
     """Return the deployed contract address, considering environment overrides."""
     return os.environ.get("SUPRA_CONTRACT_ADDRESS", BASE_CONTRACT_ADDRESS)
 
 
+@functools.lru_cache(maxsize=1)
 def get_type_args() -> tuple[str, str, str]:
     """Return the Move type arguments for the Supra contract hooks."""
     return (
@@ -104,13 +106,12 @@ def load_dotenv(path: str = ".env") -> None:
     if not os.path.exists(path):
         return
     try:
-        with open(path, "r", encoding="utf-8") as handle:
-            for raw in handle:
-                line = raw.strip()
-                if not line or line.startswith("#") or "=" not in line:
-                    continue
-                key, value = line.split("=", 1)
-                os.environ.setdefault(key.strip(), value.strip())
+        for raw in Path(path).read_text(encoding="utf-8").splitlines():
+            line = raw.strip()
+            if not line or line.startswith("#") or "=" not in line:
+                continue
+            key, value = line.split("=", 1)
+            os.environ.setdefault(key.strip(), value.strip())
     except Exception:
         # Best-effort dotenv; ignore parsing errors to match existing scripts
         pass
@@ -134,12 +135,14 @@ def decision_from_bps(bps: int) -> tuple[str, int, str, str]:
 
 def extract_rate_change_from_text_llm(text: str) -> Optional[int]:
     """Extract the rate change (in basis points) using the local LLM pipeline."""
+    from chat import OllamaUnavailableError, extract, get_warmup, is_ollama_available
+
     if not is_ollama_available():
         print("Ollama not available, skipping LLM extraction")
         return None
 
     try:
-        messages = warmup()
+        messages = get_warmup()
         return extract(text, messages)
     except OllamaUnavailableError as exc:
         print(f"Ollama unavailable: {exc}")
@@ -153,32 +156,53 @@ def simulate_threshold_signing_servers(
     public_keys: Dict[int, bytes],
     bcs_message: bytes,
     participating_servers: Sequence[int],
-) -> Dict[int, bytes]:
-    """Simulate each participating server producing and verifying a partial signature."""
-    print(f"\n=== SIMULATING {len(participating_servers)} FOMC SERVERS ===")
+) -> Tuple[Dict[int, bytes], bytes]:
+    """Simulate each participating server producing and verifying a partial signature.
+
+    Returns the partials and the combined threshold signature.
+    """
+    from threshold_signing import combine_threshold_signatures, generate_threshold_signatures, get_t
 
-    signing_private_keys = {server_id: private_keys[server_id] for server_id in participating_servers}
-    signing_public_keys = {server_id: public_keys[server_id] for server_id in participating_servers}
+    print(f"\n=== SIMULATING {len(participating_servers)} FOMC SERVERS ===")
 
-    print(f"🔗 Coordinating threshold signatures from servers: {list(participating_servers)}")
+    # Only the first t servers sign; generate_threshold_signatures picks a thread or
+    # process pool for the installed backend and batch-verifies the partials
+    signing_servers = list(participating_servers)[:get_t()]
+    print(f"🔗 Coordinating threshold signatures from servers: {signing_servers}")
     threshold_partials = generate_threshold_signatures(
-        signing_private_keys,
-        bcs_message,
-        list(participating_servers),
-        signing_public_keys,
+        private_keys, bcs_message, list(participating_servers), public_keys, verify_each=True
     )
-
-    for server_id in participating_servers:
+    for server_id in signing_servers:
         print(f"✅ Server {server_id}: Contributed partial signature")
 
-    print(f"🔗 All {len(participating_servers)} servers have generated partial signatures")
-    return threshold_partials
+    print(f"🔗 All {len(signing_servers)} servers have generated verified partial signatures")
+    # One MSM over all shares with the quorum's cached Lagrange coefficients
+    return threshold_partials, combine_threshold_signatures(threshold_partials)
+
 
+PRIVATE_KEY_LENGTH = 32  # BLS12-381 scalar
+PUBLIC_KEY_LENGTH = 48  # compressed G1 point
 
-def bool_env(name: str) -> bool:
-    """Return True if an environment variable is set to a truthy value."""
-    value = os.environ.get(name)
-    return bool(value) and value.lower() in {"1", "true", "yes", "on"}
+
+def decode_server_keys(labelled: Dict[str, str], key_length: int, path: Path, kind: str) -> Dict[int, bytes]:
+    """Decode ``server_<id>`` -> hex entries with one ``bytes.fromhex`` over the joined values."""
+    server_ids: List[int] = []
+    hex_values: List[str] = []
+    for label, hex_value in labelled.items():
+        try:
+            server_id = int(label.split("_")[1])
+        except (IndexError, ValueError) as exc:
+            raise RuntimeError(f"Invalid {kind} label '{label}' in {path}") from exc
+        if len(hex_value) != 2 * key_length:
+            raise RuntimeError(f"Invalid {kind} length for '{label}' in {path}: expected {key_length} bytes")
+        server_ids.append(server_id)
+        hex_values.append(hex_value)
+
+    decoded = bytes.fromhex("".join(hex_values))
+    return {
+        server_id: decoded[index * key_length:(index + 1) * key_length]
+        for index, server_id in enumerate(server_ids)
+    }
 
 
 def load_threshold_keys_from_files(keys_dir: str) -> Tuple[Dict[int, bytes], Dict[int, bytes], bytes, int, int]:
@@ -192,33 +216,21 @@ def load_threshold_keys_from_files(keys_dir: str) -> Tuple[Dict[int, bytes], Dic
             f"Threshold key files not found in {keys_path}. Run setup_keys.py or pass --fresh-keys."
         )
 
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError, so one handler covers both
+    loads = orjson.loads if orjson is not None else json.loads
     try:
-        with priv_path.open("r", encoding="utf-8") as handle:
-            priv_data = json.load(handle)
-        with pub_path.open("r", encoding="utf-8") as handle:
-            pub_data = json.load(handle)
+        priv_data = loads(priv_path.read_bytes())
+        pub_data = loads(pub_path.read_bytes())
     except json.JSONDecodeError as exc:
         raise RuntimeError(f"Failed to parse key JSON files in {keys_path}: {exc}") from exc
 
-    private_keys: Dict[int, bytes] = {}
-    for label, hex_value in priv_data.items():
-        try:
-            server_id = int(label.split("_")[1])
-        except (IndexError, ValueError) as exc:
-            raise RuntimeError(f"Invalid server key label '{label}' in {priv_path}") from exc
-        private_keys[server_id] = bytes.fromhex(hex_value)
+    private_keys = decode_server_keys(priv_data, PRIVATE_KEY_LENGTH, priv_path, "server key")
 
     server_publics = pub_data.get("server_public_keys")
     if not isinstance(server_publics, dict):
         raise RuntimeError(f"Missing server_public_keys in {pub_path}")
 
-    public_keys: Dict[int, bytes] = {}
-    for label, hex_value in server_publics.items():
-        try:
-            server_id = int(label.split("_")[1])
-        except (IndexError, ValueError) as exc:
-            raise RuntimeError(f"Invalid server public key label '{label}' in {pub_path}") from exc
-        public_keys[server_id] = bytes.fromhex(hex_value)
+    public_keys = decode_server_keys(server_publics, PUBLIC_KEY_LENGTH, pub_path, "server public key")
 
     group_hex = pub_data.get("group_public_key")
     if not isinstance(group_hex, str):
@@ -237,6 +249,8 @@ def obtain_threshold_keys(
     requested_config: Optional[Tuple[int, int]] = None,
 ) -> Tuple[Dict[int, bytes], Dict[int, bytes], bytes, bool]:
     """Return threshold key material, loading from disk unless forced to generate."""
+    from threshold_signing import generate_threshold_keys, set_threshold_config
+
     if not generate_new:
         try:
             private_keys, public_keys, group_public_key, total_servers, threshold = load_threshold_keys_from_files(keys_dir)
@@ -257,34 +271,49 @@ def obtain_threshold_keys(
     return private_keys, public_keys, group_public_key, False
 
 
-def run_cli(cmd: List[str]) -> subprocess.CompletedProcess[str]:
-    """Execute a Supra CLI command, surfacing stdout/stderr on success or failure."""
+def run_cli(cmd: List[str]) -> subprocess.CompletedProcess[bytes]:
+    """Execute a Supra CLI command, echoing stdout/stderr line by line as it runs."""
     print("CLI command:\n  " + " ".join(cmd))
     try:
-        result = subprocess.run(cmd, check=True, capture_output=True, text=True)
+        proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
     except FileNotFoundError as exc:
         raise RuntimeError(f"Supra CLI not found: {cmd[0]}") from exc
-    except subprocess.CalledProcessError as exc:
-        print("=== CLI call failed ===")
-        print(exc.stdout)
-        print(exc.stderr)
-        raise
-
-    if result.stdout.strip():
-        print(result.stdout.strip())
-    if result.stderr.strip():
-        print("Stderr:")
-        print(result.stderr.strip())
-    return result
 
+    # Multiplex both pipes so neither fills up, printing complete lines as they arrive
+    # instead of holding the whole log until the process exits.
+    with proc, selectors.DefaultSelector() as selector:
+        selector.register(proc.stdout, selectors.EVENT_READ, (sys.stdout, bytearray()))
+        selector.register(proc.stderr, selectors.EVENT_READ, (sys.stderr, bytearray()))
+        while selector.get_map():
+            for key, _events in selector.select():
+                stream, pending = key.data
+                chunk = os.read(key.fd, 65536)
+                if not chunk:
+                    if pending:
+                        print(pending.decode(errors="replace"), file=stream)
+                    selector.unregister(key.fileobj)
+                    continue
+                pending += chunk
+                *lines, rest = pending.split(b"\n")
+                for line in lines:
+                    print(line.decode(errors="replace"), file=stream)
+                pending[:] = rest
+        returncode = proc.wait()
+
+    if returncode != 0:
+        print("=== CLI call failed ===")
+        raise subprocess.CalledProcessError(returncode, cmd)
+    return subprocess.CompletedProcess(cmd, returncode)
 
-def set_bls_public_key_cli(group_public_key: bytes, profile: str, cli_path: str) -> None:
-    """Upload the freshly generated group public key to the Supra contract."""
-    contract_address = get_contract_address()
-    function_id = f"{contract_address}::fomc_interest_rate_dexlyn::set_bls_public_key"
-    args = [f"hex:{group_public_key.hex()}"]
 
-    print("\n=== SETTING BLS PUBLIC KEY ONCHAIN (SUPRA) ===")
+def build_move_run_cmd(
+    cli_path: str,
+    function_id: str,
+    type_args: Sequence[str],
+    args: Sequence[str],
+    profile: str,
+) -> List[str]:
+    """Build a `supra move tool run` command line with the standard gas settings."""
     cmd = [
         cli_path,
         "move",
@@ -292,8 +321,11 @@ def set_bls_public_key_cli(group_public_key: bytes, profile: str, cli_path: str)
         "run",
         "--function-id",
         function_id,
-        "--args",
-    ] + args + [
+    ]
+    if type_args:
+        cmd += ["--type-args", *type_args]
+    cmd += ["--args", *args]
+    cmd += [
         "--profile",
         profile,
         "--max-gas",
@@ -302,8 +334,26 @@ def set_bls_public_key_cli(group_public_key: bytes, profile: str, cli_path: str)
         "100",
         "--assume-yes",
     ]
+    return cmd
 
-    run_cli(cmd)
+
+def rate_movement_args(abs_bps: int, is_increase: bool, signature: bytes) -> List[str]:
+    """Return the CLI arguments describing a signed rate movement."""
+    return [
+        f"u64:{abs_bps}",
+        f"bool:{str(is_increase).lower()}",
+        f"hex:{signature.hex()}",
+    ]
+
+
+def set_bls_public_key_cli(group_public_key: bytes, profile: str, cli_path: str) -> None:
+    """Upload the freshly generated group public key to the Supra contract."""
+    contract_address = get_contract_address()
+    function_id = f"{contract_address}::fomc_interest_rate_dexlyn::set_bls_public_key"
+    args = [f"hex:{group_public_key.hex()}"]
+
+    print("\n=== SETTING BLS PUBLIC KEY ONCHAIN (SUPRA) ===")
+    run_cli(build_move_run_cmd(cli_path, function_id, [], args, profile))
     print("✅ BLS public key submitted to Supra testnet")
 
 
@@ -317,53 +367,64 @@ def submit_interest_rate_transaction(
     """Execute the Supra CLI transaction to record the interest rate movement."""
     contract_address = get_contract_address()
     function_id = f"{contract_address}::fomc_interest_rate_dexlyn::record_interest_rate_movement_dexlyn"
-    type_args = list(get_type_args())
-    args = [
-        f"u64:{abs_bps}",
-        f"bool:{str(is_increase).lower()}",
-        f"hex:{signature.hex()}",
-    ]
+    args = rate_movement_args(abs_bps, is_increase, signature)
 
     print("\n=== SUBMITTING SUPRA TRANSACTION ===")
-    cmd = [
-        cli_path,
-        "move",
-        "tool",
-        "run",
-        "--function-id",
-        function_id,
-        "--type-args",
-    ] + type_args + [
-        "--args",
-    ] + args + [
-        "--profile",
-        profile,
-        "--max-gas",
-        "1000",
-        "--gas-unit-price",
-        "100",
-        "--assume-yes",
-    ]
-
-    run_cli(cmd)
+    run_cli(build_move_run_cmd(cli_path, function_id, get_type_args(), args, profile))
     print("✅ Supra transaction executed")
 
 
+def set_key_and_submit_interest_rate_transaction(
+    group_public_key: bytes,
+    abs_bps: int,
+    is_increase: bool,
+    signature: bytes,
+    profile: str,
+    cli_path: str,
+) -> None:
+    """Set the group public key and record the rate movement with a single CLI call.
+
+    Only for --combined-set-key: the entry point exists once the Move package is republished.
+    """
+    contract_address = get_contract_address()
+    function_id = (
+        f"{contract_address}::fomc_interest_rate_dexlyn::set_key_and_record_interest_rate_movement_dexlyn"
+    )
+    args = [f"hex:{group_public_key.hex()}"] + rate_movement_args(abs_bps, is_increase, signature)
+
+    print("\n=== SETTING BLS PUBLIC KEY AND SUBMITTING SUPRA TRANSACTION ===")
+    run_cli(build_move_run_cmd(cli_path, function_id, get_type_args(), args, profile))
+    print("✅ BLS public key set and Supra transaction executed")
+
+
 def detect_basis_points(input_text_or_url: str) -> Optional[int]:
     """Determine the basis point change from either URL or inline text."""
-    if input_text_or_url.startswith("http://") or input_text_or_url.startswith("https://"):
+    from chat import OllamaUnavailableError, extract, get_article_text, get_warmup, is_ollama_available
+    from find_rate_reduction import extract_rate_change_from_text, find_rate_reduction
+
+    if input_text_or_url.startswith(_URL_PREFIXES):
+        # The LLM warmup does not depend on the article, so run it while the page downloads
+        pool = ThreadPoolExecutor(max_workers=2)
+        article_text = None
         try:
-            article_text = get_article_text(input_text_or_url)
-            if article_text and is_ollama_available():
-                try:
-                    messages = warmup()
-                    return extract(article_text, messages)
-                except OllamaUnavailableError as exc:
-                    print(f"Ollama unavailable: {exc}")
-            return find_rate_reduction(input_text_or_url)
+            text_future = pool.submit(get_article_text, input_text_or_url)
+            warmup_future = pool.submit(get_warmup) if is_ollama_available() else None
+            article_text = text_future.result()
+            if article_text and warmup_future is not None:
+                messages = warmup_future.result()
+                return extract(article_text, messages)
+        except OllamaUnavailableError as exc:
+            print(f"Ollama unavailable: {exc}")
         except Exception as exc:
             print(f"Error processing URL, falling back to regex: {exc}")
-            return find_rate_reduction(input_text_or_url)
+        finally:
+            # A failed fetch goes straight to the regex; don't wait for a warmup it won't use
+            pool.shutdown(wait=False, cancel_futures=True)
+        # Same fallback as threshold_integration_test: regex over the fetched article,
+        # fetching the raw page only when that text is missing
+        if article_text:
+            return extract_rate_change_from_text(article_text)
+        return find_rate_reduction(input_text_or_url)
     return extract_rate_change_from_text_llm(input_text_or_url)
 
 
@@ -375,8 +436,25 @@ def run_threshold_integration_supra(
     skip_set_key: bool = False,
     keys_dir: str = DEFAULT_KEYS_DIR,
     generate_new_keys: bool = False,
+    verify_locally: bool = False,
+    dry_run: bool = False,
+    combined_set_key: bool = False,
 ) -> int:
-    """Main execution path for Supra threshold signing integration."""
+    """Main execution path for Supra threshold signing integration.
+
+    Local verification of the combined signature is diagnostic only (every partial
+    was already verified and the contract re-verifies), so it runs only with
+    ``verify_locally``. With ``dry_run`` the Supra CLI is never invoked, so the key
+    loading, detection and signing pipeline can be timed on its own. With
+    ``combined_set_key`` the key update and the rate movement go out as one transaction.
+    """
+    from threshold_signing import (
+        create_bcs_message_for_fomc,
+        get_n,
+        get_t,
+        verify_signature,
+    )
+
     print("🚀 Starting FOMC Threshold Signing Integration (Supra)")
 
     requested_config = (get_n(), get_t())
@@ -411,7 +489,7 @@ def run_threshold_integration_supra(
         return 1
     bps = coerce_bps(bps)
 
-    source = "URL" if input_text_or_url.startswith(("http://", "https://")) else "inline-text"
+    source = "URL" if input_text_or_url.startswith(_URL_PREFIXES) else "inline-text"
     print(f"📈 Detected change: {bps} bps from {source}")
     abs_bps = abs(bps)
     is_increase = bps > 0
@@ -443,33 +521,62 @@ def run_threshold_integration_supra(
         return 1
     print(f"🖥️  Participating servers: {participating_servers}")
 
-    partial_signatures = simulate_threshold_signing_servers(
+    _partial_signatures, threshold_signature = simulate_threshold_signing_servers(
         private_keys,
         public_keys,
         bcs_message,
         participating_servers,
     )
 
-    # 5) Combine partial signatures
+    # 5) Combine partial signatures (collected first, then combined in one MSM)
     print("\n=== THRESHOLD SIGNATURE COMBINATION ===")
-    threshold_signature = combine_threshold_signatures(partial_signatures)
     print(f"🔐 Threshold signature: {threshold_signature.hex()[:32]}...")
 
-    # 6) Optional local verification
+    # 6) Optional local verification, overlapped with the CLI call in step 7
     print("\n=== LOCAL VERIFICATION (OPTIONAL) ===")
-    if verify_signature(group_public_key, bcs_message, threshold_signature):
-        print("✅ Threshold signature verified against group public key")
-    else:
-        print("⚠️ Threshold signature failed local verification (contract will verify)")
-
-    # 7) Execute Supra CLI calls
-    print("\n=== SUPRA CLI EXECUTION ===")
-    if skip_set_key:
-        print("Skipping set_bls_public_key (pass --set-key or SUPRA_SET_KEY=1 to enable)")
-    else:
-        set_bls_public_key_cli(group_public_key, profile, cli_path)
+    with ThreadPoolExecutor(max_workers=1) as verify_pool:
+        if not verify_locally:
+            print("Skipping local verification (pass --verify to enable; contract will verify)")
+            verification = None
+        else:
+            print("🔍 Verifying threshold signature in the background")
+            verification = verify_pool.submit(
+                verify_signature, group_public_key, bcs_message, threshold_signature
+            )
 
-    submit_interest_rate_transaction(abs_bps, is_increase, threshold_signature, profile, cli_path)
+        # 7) Execute Supra CLI calls
+        print("\n=== SUPRA CLI EXECUTION ===")
+        if dry_run:
+            if not skip_set_key and combined_set_key:
+                print(
+                    f"DRY RUN: would call set_key_and_record_interest_rate_movement_dexlyn with "
+                    f"{group_public_key.hex()[:32]}... ({abs_bps} bps, increase={is_increase}) "
+                    f"with profile {profile}"
+                )
+            else:
+                if not skip_set_key:
+                    print(f"DRY RUN: would call set_bls_public_key with {group_public_key.hex()[:32]}...")
+                print(
+                    f"DRY RUN: would call record_interest_rate_movement_dexlyn "
+                    f"({abs_bps} bps, increase={is_increase}) with profile {profile}"
+                )
+        elif skip_set_key:
+            print("Skipping set_bls_public_key (pass --set-key or SUPRA_SET_KEY=1 to enable)")
+            submit_interest_rate_transaction(abs_bps, is_increase, threshold_signature, profile, cli_path)
+        elif combined_set_key:
+            # One transaction sets the key and records the movement, so only one CLI process starts
+            set_key_and_submit_interest_rate_transaction(
+                group_public_key, abs_bps, is_increase, threshold_signature, profile, cli_path
+            )
+        else:
+            set_bls_public_key_cli(group_public_key, profile, cli_path)
+            submit_interest_rate_transaction(abs_bps, is_increase, threshold_signature, profile, cli_path)
+
+        if verification is not None:
+            if verification.result():
+                print("✅ Threshold signature verified against group public key")
+            else:
+                print("⚠️ Threshold signature failed local verification (contract will verify)")
     print("\n🎉 Supra threshold integration completed successfully")
     return 0
 
@@ -516,11 +623,29 @@ def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
         action="store_true",
         help="Also call set_bls_public_key before submitting the transaction",
     )
+    parser.add_argument(
+        "--combined-set-key",
+        action="store_true",
+        help=(
+            "With --set-key, set the key and record the movement in one transaction "
+            "(requires the republished Move package)"
+        ),
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Run detection and signing but only print the Supra CLI calls instead of executing them",
+    )
     parser.add_argument(
         "--fresh-keys",
         action="store_true",
         help="Generate a new threshold key set for this run (does not persist)",
     )
+    parser.add_argument(
+        "--verify",
+        action="store_true",
+        help="Verify the combined signature locally before submitting (the contract always verifies)",
+    )
     keys_default = os.environ.get("SUPRA_KEYS_DIR", DEFAULT_KEYS_DIR)
     parser.add_argument(
         "--keys-dir",
@@ -542,6 +667,8 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
     args = parse_args(argv)
 
     if args.n is not None or args.t is not None:
+        from threshold_signing import get_n, get_t, set_threshold_config
+
         current_n, current_t = get_n(), get_t()
         n = args.n if args.n is not None else current_n
         t = args.t if args.t is not None else current_t
@@ -572,6 +699,9 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
             skip_set_key,
             keys_dir,
             fresh_keys,
+            args.verify,
+            args.dry_run,
+            args.combined_set_key or bool_env("SUPRA_COMBINED_SET_KEY"),
         )
     except subprocess.CalledProcessError:
         return 1
@@ -11,9 +11,13 @@ This integration test demonstrates threshold signing where:
 """
 
 import asyncio
+import functools
+import json
 import os
+import re
 import sys
-from typing import Optional, Dict, List
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional, Dict, Sequence, Tuple
 
 import yaml
 import requests
@@ -24,10 +28,11 @@ from aptos_sdk.bcs import Serializer
 from aptos_sdk.transactions import EntryFunction, TransactionArgument, TransactionPayload
 from aptos_sdk.type_tag import StructTag, TypeTag
 
-from find_rate_reduction import find_rate_reduction
+from find_rate_reduction import extract_rate_change_from_text, find_rate_reduction
 from contract_utils import resolve_module_address
+from env_utils import bool_env
 from chat import (
-    warmup,
+    get_warmup,
     extract,
     get_article_text,
     is_ollama_available,
@@ -43,9 +48,13 @@ from threshold_signing import (
 )
 
 try:
-    from py_ecc.bls.ciphersuites import G2ProofOfPossession as bls
-except Exception:
-    bls = None
+    import uvloop
+except ImportError:
+    uvloop = None
+
+
+# KEY=VALUE lines; comment lines can't match because a key never starts with '#'
+_DOTENV_LINE = re.compile(r"^[ \t]*([^#=\s][^=\n]*?)[ \t]*=(.*)$", re.MULTILINE)
 
 
 def _load_dotenv(path: str = ".env") -> None:
@@ -53,12 +62,9 @@ def _load_dotenv(path: str = ".env") -> None:
         return
     try:
         with open(path, "r") as f:
-            for line in f:
-                s = line.strip()
-                if not s or s.startswith("#") or "=" not in s:
-                    continue
-                k, v = s.split("=", 1)
-                os.environ.setdefault(k.strip(), v.strip())
+            # Reversed so the first occurrence of a key wins, as with setdefault
+            pairs = dict(reversed(_DOTENV_LINE.findall(f.read())))
+        os.environ.update({k: v.strip() for k, v in pairs.items() if k not in os.environ})
     except Exception:
         pass
 
@@ -74,10 +80,34 @@ CURVE_TYPE = os.environ.get(
     "0x43417434fd869edee76cca2a4d2301e528a1551b1d719b75c350c3c97d15b8b9::curves::Uncorrelated",
 )
 
+# Parsed once; the entry function builders reuse these tags for every transaction
+APT_TYPE_TAG = TypeTag(StructTag.from_str(APT_TYPE))
+USDT_TYPE_TAG = TypeTag(StructTag.from_str(USDT_TYPE))
+
+# Gas simulation before submitting is a debugging aid; it costs an extra REST round-trip
+SIMULATE = bool_env("THRESHOLD_SIMULATE")
+
+
+@functools.lru_cache(maxsize=1)
+def _interest_rate_module_address() -> str:
+    """Resolve the interest_rate module address once per process."""
+    return resolve_module_address("interest_rate")
+
+
+# libyaml's C loader when PyYAML was built with it
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+@functools.lru_cache(maxsize=4)
+def _parse_aptos_config(path: str, mtime: float) -> dict:
+    """Parse the Aptos CLI config; mtime is part of the cache key so edits are picked up."""
+    with open(path, "r") as f:
+        return yaml.load(f, Loader=_YAML_LOADER)
+
 
 async def load_ctx(profile_name: str = "default"):
-    with open(".aptos/config.yaml", "r") as f:
-        cfg = yaml.safe_load(f)
+    config_path = ".aptos/config.yaml"
+    cfg = _parse_aptos_config(config_path, os.path.getmtime(config_path))
     prof = cfg["profiles"][profile_name]
     # Use AIP-80 key format directly
     priv = prof["private_key"]
@@ -100,32 +130,38 @@ async def balance(rest: RestClient, addr: AccountAddress, coin_type: str) -> int
     return int(await rest.account_balance(addr, coin_type=coin_type))
 
 
+# (action_text, pct, from_coin_type, to_coin_type) per rate-move bucket
+_DECISIONS = (
+    ("Decrease ≥50 bps: buy USDT with 30% of APT", 30, APT_TYPE, USDT_TYPE),
+    ("Decrease ≥25 bps: buy USDT with 10% of APT", 10, APT_TYPE, USDT_TYPE),
+    # smaller cuts treated same as no-change per spec
+    ("Small cut: buy APT with 30% of USDT", 30, USDT_TYPE, APT_TYPE),
+    ("No change: buy APT with 30% of USDT", 30, USDT_TYPE, APT_TYPE),
+    ("Increase: buy APT with 30% of USDT", 30, USDT_TYPE, APT_TYPE),
+)
+
+
 def decision_from_bps(bps: int) -> tuple[str, int, str, str]:
     # Returns: (action_text, pct, from_coin_type, to_coin_type)
+    if bps <= -50:
+        return _DECISIONS[0]
+    if bps <= -25:
+        return _DECISIONS[1]
     if bps < 0:
-        cut = -bps
-        if cut >= 50:
-            return ("Decrease ≥50 bps: buy USDT with 30% of APT", 30, APT_TYPE, USDT_TYPE)
-        if cut >= 25:
-            return ("Decrease ≥25 bps: buy USDT with 10% of APT", 10, APT_TYPE, USDT_TYPE)
-        # smaller cuts treated same as no-change per spec
-        return ("Small cut: buy APT with 30% of USDT", 30, USDT_TYPE, APT_TYPE)
-    elif bps == 0:
-        return ("No change: buy APT with 30% of USDT", 30, USDT_TYPE, APT_TYPE)
-    else:
-        return ("Increase: buy APT with 30% of USDT", 30, USDT_TYPE, APT_TYPE)
+        return _DECISIONS[2]
+    return _DECISIONS[3] if bps == 0 else _DECISIONS[4]
 
 
 async def set_bls_public_key_threshold(rest: RestClient, account: Account, group_public_key: bytes) -> str:
-    """Set the BLS public key in the contract before calling the main function."""
-    module_addr = resolve_module_address("interest_rate")
+    """Set the BLS public key in the contract before calling the main function (default two-transaction path)."""
+    module_addr = _interest_rate_module_address()
     
     entry = EntryFunction.natural(
         f"{module_addr}::interest_rate",
         "set_bls_public_key",
         [],
         [
-            TransactionArgument(list(group_public_key), Serializer.sequence_serializer(Serializer.u8)),
+            TransactionArgument(group_public_key, Serializer.to_bytes),
         ],
     )
     payload = TransactionPayload(entry)
@@ -141,36 +177,50 @@ async def call_move_real_swap_threshold(
     abs_bps: int,
     is_increase: bool,
     threshold_signature: bytes,
-    group_public_key: bytes
+    group_public_key: bytes,
+    combined_set_key: bool = False,
 ) -> str:
     """
     Call the smart contract with threshold signature and group public key.
+    
+    By default this records the rate movement only; the key must already be set with
+    set_bls_public_key_threshold. With combined_set_key the key update and the signed
+    rate movement go out as one transaction through
+    set_key_and_record_interest_rate_movement_v5, which needs the republished module.
     """
-    module_addr = resolve_module_address("interest_rate")
+    module_addr = _interest_rate_module_address()
     
     # Prepare BCS message (same format as original)
     msg = create_bcs_message_for_fomc(abs_bps, is_increase)
     
+    args = [
+        TransactionArgument(abs_bps, Serializer.u64),
+        TransactionArgument(is_increase, Serializer.bool),
+        TransactionArgument(threshold_signature, Serializer.to_bytes),
+    ]
+    if combined_set_key:
+        function = "set_key_and_record_interest_rate_movement_v5"
+        args.insert(0, TransactionArgument(group_public_key, Serializer.to_bytes))
+    else:
+        function = "record_interest_rate_movement_v5"
+    
     entry = EntryFunction.natural(
         f"{module_addr}::interest_rate",
-        "record_interest_rate_movement_v5",
+        function,
         [
-            TypeTag(StructTag.from_str(APT_TYPE)),
-            TypeTag(StructTag.from_str(USDT_TYPE)),
-        ],
-        [
-            TransactionArgument(abs_bps, Serializer.u64),
-            TransactionArgument(is_increase, Serializer.bool),
-            TransactionArgument(list(threshold_signature), Serializer.sequence_serializer(Serializer.u8)),
+            APT_TYPE_TAG,
+            USDT_TYPE_TAG,
         ],
+        args,
     )
     payload = TransactionPayload(entry)
-    try:
-        raw = await rest.create_bcs_transaction(account, payload)
-        sim = await rest.simulate_transaction(raw, account, estimate_gas_usage=True)
-        print(f"Simulation: {sim}")
-    except Exception as e:
-        print(f"Simulation failed (continuing): {e}")
+    if SIMULATE:
+        try:
+            raw = await rest.create_bcs_transaction(account, payload)
+            sim = await rest.simulate_transaction(raw, account, estimate_gas_usage=True)
+            print(f"Simulation: {sim}")
+        except Exception as e:
+            print(f"Simulation failed (continuing): {e}")
     signed = await rest.create_bcs_signed_transaction(account, payload)
     txh = await rest.submit_bcs_transaction(signed)
     await rest.wait_for_transaction(txh)
@@ -193,7 +243,7 @@ def extract_rate_change_from_text_llm(text: str) -> Optional[int]:
         return None
 
     try:
-        messages = warmup()
+        messages = get_warmup()
         return extract(text, messages)
     except OllamaUnavailableError as e:
         print(f"Ollama unavailable: {e}")
@@ -206,7 +256,8 @@ def simulate_threshold_signing_servers(
     private_keys: Dict[int, bytes],
     public_keys: Dict[int, bytes],
     bcs_message: bytes,
-    participating_servers: List[int]
+    participating_servers: Sequence[int],
+    allow_processes: bool = True,
 ) -> Dict[int, bytes]:
     """
     Simulate the threshold signing process across multiple servers.
@@ -220,43 +271,105 @@ def simulate_threshold_signing_servers(
         private_keys: Dict mapping server ID to private key bytes
         public_keys: Dict mapping server ID to public key bytes
         bcs_message: The BCS message to sign
-        participating_servers: List of server IDs that will participate
+        participating_servers: Server IDs that will participate (any sequence, e.g. a range)
+        allow_processes: Passed to generate_threshold_signatures; False when running
+            in a worker thread of the event loop, where forking is unsafe
     
     Returns:
         Dict mapping server ID to partial signature bytes
     """
     print(f"\n=== SIMULATING {len(participating_servers)} FOMC SERVERS ===")
     
-    # Extract only the participating servers' private keys
-    participating_private_keys = {
-        server_id: private_keys[server_id]
-        for server_id in participating_servers
-    }
-    
-    # Extract only the participating servers' public keys
-    participating_public_keys = {
-        server_id: public_keys[server_id]
-        for server_id in participating_servers
-    }
-    
-    # Generate all threshold signatures at once (this simulates the coordination)
-    print(f"🔗 Coordinating threshold signatures from servers: {participating_servers}")
+    # generate_threshold_signatures signs with the first t servers (in a pool only when
+    # that pays off for the installed backend) and batch-verifies the partials
+    signing_servers = list(participating_servers)[:get_t()]
+    print(f"🔗 Coordinating threshold signatures from servers: {signing_servers}")
     threshold_signatures = generate_threshold_signatures(
-        participating_private_keys,
-        bcs_message,
-        participating_servers,
-        participating_public_keys
+        private_keys, bcs_message, list(participating_servers), public_keys, verify_each=True,
+        allow_processes=allow_processes,
     )
     
     # Simulate each server contributing their signature
-    for server_id in participating_servers:
+    for server_id in signing_servers:
         print(f"✅ Server {server_id}: Contributed partial signature")
     
-    print(f"🔗 All {len(participating_servers)} servers have generated partial signatures")
+    print(f"🔗 All {len(signing_servers)} servers have generated verified partial signatures")
     return threshold_signatures
 
 
-async def run_threshold_integration(input_text_or_url: str):
+def sign_and_combine(
+    private_keys: Dict[int, bytes],
+    public_keys: Dict[int, bytes],
+    bcs_message: bytes,
+    participating_servers: Sequence[int]
+) -> bytes:
+    """
+    Collect partial signatures from the participating servers and combine them.
+    
+    Runs in an executor thread while the event loop is live, so it never forks a process pool.
+    """
+    partial_signatures = simulate_threshold_signing_servers(
+        private_keys, public_keys, bcs_message, participating_servers, allow_processes=False
+    )
+    return combine_threshold_signatures(partial_signatures)
+
+
+def generate_keys_for_config(n: int, t: int) -> Tuple[Dict[int, bytes], Dict[int, bytes], bytes]:
+    """
+    Generate threshold keys for an explicit n/t (safe to run in a worker process).
+    
+    With REUSE_KEYS=1 the key set is cached in .threshold_keys_<n>_<t>.json and
+    reused by later runs; test key material only, never for production keys.
+    """
+    set_threshold_config(n, t)
+    if not bool_env("REUSE_KEYS"):
+        return generate_threshold_keys()
+
+    cache_path = f".threshold_keys_{n}_{t}.json"
+    if os.path.exists(cache_path):
+        with open(cache_path, "r") as f:
+            cached = json.load(f)
+        print(f"🔑 Reusing threshold keys from {cache_path}")
+        return (
+            {int(sid): bytes.fromhex(key) for sid, key in cached["private_keys"].items()},
+            {int(sid): bytes.fromhex(key) for sid, key in cached["public_keys"].items()},
+            bytes.fromhex(cached["group_public_key"]),
+        )
+
+    private_keys, public_keys, group_public_key = generate_threshold_keys()
+    with open(cache_path, "w") as f:
+        json.dump({
+            "private_keys": {sid: key.hex() for sid, key in private_keys.items()},
+            "public_keys": {sid: key.hex() for sid, key in public_keys.items()},
+            "group_public_key": group_public_key.hex(),
+        }, f)
+    return private_keys, public_keys, group_public_key
+
+
+async def read_starting_balances(ctx_task: "asyncio.Task", from_coin: str, to_coin: str):
+    """
+    Wait for the chain context and read the starting balances.
+    
+    Returns (account, rest, from_before, to_before).
+    """
+    account, rest = await ctx_task
+    addr = account.address()
+    from_before, to_before = await asyncio.gather(
+        balance(rest, addr, from_coin), balance(rest, addr, to_coin)
+    )
+    return account, rest, from_before, to_before
+
+
+async def close_ctx(ctx_task: "asyncio.Task") -> None:
+    """Close the REST client opened by a load_ctx() task, if it connected at all."""
+    try:
+        _account, rest = await ctx_task
+    except Exception:
+        return
+    await rest.close()
+
+
+async def run_threshold_integration(input_text_or_url: str, combined_set_key: bool = False):
     """
     Run the threshold signing integration test.
     
@@ -271,31 +384,67 @@ async def run_threshold_integration(input_text_or_url: str):
     n, t = get_n(), get_t()
     print(f"📊 Configuration: {n} servers, {t}-of-{n} threshold")
     
-    # 1) Generate threshold keys for FOMC servers
+    # 1) Generate threshold keys for FOMC servers. Key generation is CPU-bound,
+    # so it runs in a worker process while the REST client connects.
+    # A URL's article is fetched in a thread over the same window.
     print("\n=== THRESHOLD KEY GENERATION ===")
-    private_keys, public_keys, group_public_key = generate_threshold_keys()
-    
+    ctx_task = asyncio.create_task(load_ctx())
+    article_task = None
+    if input_text_or_url.startswith(("http://", "https://")):
+        article_task = asyncio.create_task(asyncio.to_thread(get_article_text, input_text_or_url))
+    try:
+        with ProcessPoolExecutor(max_workers=1) as keygen_pool:
+            private_keys, public_keys, group_public_key = await asyncio.get_running_loop().run_in_executor(
+                keygen_pool, generate_keys_for_config, n, t
+            )
+        return await _run_with_keys(
+            input_text_or_url, ctx_task, article_task, private_keys, public_keys, group_public_key,
+            combined_set_key,
+        )
+    finally:
+        if article_task is not None:
+            await asyncio.gather(article_task, return_exceptions=True)
+        await close_ctx(ctx_task)
+
+
+async def _run_with_keys(
+    input_text_or_url: str,
+    ctx_task: "asyncio.Task",
+    article_task: Optional["asyncio.Task"],
+    private_keys: Dict[int, bytes],
+    public_keys: Dict[int, bytes],
+    group_public_key: bytes,
+    combined_set_key: bool = False,
+) -> int:
+    """Steps 2-7 of run_threshold_integration; ctx_task is closed by the caller."""
+    n, t = get_n(), get_t()
     print(f"✅ Generated keys for {n} FOMC servers")
     print(f"🔑 Group public key: {group_public_key.hex()[:32]}...")
     
     # 2) Extract basis points from input
     print(f"\n=== RATE CHANGE EXTRACTION ===")
-    if input_text_or_url.startswith("http://") or input_text_or_url.startswith("https://"):
-        # For URLs, we can use either the existing regex approach or LLM approach
+    if article_task is not None:
+        # For URLs, use the LLM when it's reachable and fall back to the regex
+        # approach on any failure (is_ollama_available() caches its probe).
+        # Both extractors read the article text fetched during key generation; the
+        # regex only fetches the page itself when that text is missing.
+        bps = None
+        use_regex = True
+        article_text = None
         try:
-            article_text = get_article_text(input_text_or_url)
+            article_text = await article_task
             if article_text and is_ollama_available():
-                try:
-                    messages = warmup()
-                    bps = extract(article_text, messages)
-                except OllamaUnavailableError as e:
-                    print(f"Ollama unavailable: {e}")
-                    bps = find_rate_reduction(input_text_or_url)
-            else:
-                bps = find_rate_reduction(input_text_or_url)
+                bps = await asyncio.to_thread(lambda: extract(article_text, get_warmup()))
+                use_regex = False
+        except OllamaUnavailableError as e:
+            print(f"Ollama unavailable: {e}")
         except Exception as e:
             print(f"Error with LLM approach, falling back to regex: {e}")
-            bps = find_rate_reduction(input_text_or_url)
+        if use_regex and article_text:
+            bps = extract_rate_change_from_text(article_text)
+        elif use_regex:
+            # The fetch failed or found no paragraphs; let the regex fallback fetch the raw page
+            bps = await asyncio.to_thread(find_rate_reduction, input_text_or_url)
         source = input_text_or_url
     else:
         bps = extract_rate_change_from_text_llm(input_text_or_url)
@@ -319,17 +468,22 @@ async def run_threshold_integration(input_text_or_url: str):
 
     # 4) Simulate threshold signing with t out of n servers
     print(f"\n=== THRESHOLD SIGNING SIMULATION ===")
-    participating_servers = list(range(1, t + 1))  # Use first t servers (any t would work)
-    print(f"🖥️  Participating servers: {participating_servers}")
+    participating_servers = range(1, t + 1)  # Use first t servers (any t would work)
+    print(f"🖥️  Participating servers: {list(participating_servers)}")
     
-    # Simulate each server generating their partial signature
-    partial_signatures = simulate_threshold_signing_servers(
-        private_keys, public_keys, bcs_message, participating_servers
-    )
+    # The balance reads don't depend on the signature, so they run while the servers
+    # sign in a worker thread
+    balances_task = asyncio.create_task(read_starting_balances(ctx_task, from_coin, to_coin))
+    try:
+        threshold_signature = await asyncio.get_running_loop().run_in_executor(
+            None, sign_and_combine, private_keys, public_keys, bcs_message, participating_servers
+        )
+    except BaseException:
+        await asyncio.gather(balances_task, return_exceptions=True)
+        raise
     
     # 5) Combine partial signatures into threshold signature
     print(f"\n=== THRESHOLD SIGNATURE COMBINATION ===")
-    threshold_signature = combine_threshold_signatures(partial_signatures)
     print(f"🔐 Combined threshold signature: {threshold_signature.hex()[:32]}...")
     
     # 6) Setup chain context and execute transaction (skip local verification, let smart contract verify)
@@ -339,42 +493,46 @@ async def run_threshold_integration(input_text_or_url: str):
 
     # 7) Setup chain context and execute transaction
     print(f"\n=== ON-CHAIN EXECUTION ===")
-    account, rest = await load_ctx()
-    try:
-        # Read balances before
-        addr = account.address()
-        from_before = await balance(rest, addr, from_coin)
-        to_before = await balance(rest, addr, to_coin)
-        print(f"💰 Before: from={from_before} to={to_before}")
+    account, rest, from_before, to_before = await balances_task
+    addr = account.address()
+    print(f"💰 Before: from={from_before} to={to_before}")
 
-        # Set BLS public key in the contract first
+    if not combined_set_key:
+        # Rotate the on-chain key only after signing succeeded, so a failed run leaves it alone
         key_txh = await set_bls_public_key_threshold(rest, account, group_public_key)
         print(f"✅ BLS group public key set. Tx: {key_txh}")
 
-        # Execute on-chain transaction with threshold signature
-        txh = await call_move_real_swap_threshold(
-            rest, account, abs_bps, is_increase, threshold_signature, group_public_key
-        )
+    txh = await call_move_real_swap_threshold(
+        rest, account, abs_bps, is_increase, threshold_signature, group_public_key, combined_set_key
+    )
+    if combined_set_key:
+        print(f"✅ BLS group public key set and threshold transaction executed. Tx: {txh}")
+    else:
         print(f"✅ On-chain threshold transaction executed. Tx: {txh}")
 
-        # Read balances after
-        from_after = await balance(rest, addr, from_coin)
-        to_after = await balance(rest, addr, to_coin)
-        print(f"💰 After:  from={from_after} to={to_after}")
-        print(f"📊 Δ from: {from_after - from_before}")
-        print(f"📊 Δ to:   {to_after - to_before}")
-        
-        print(f"\n🎉 THRESHOLD SIGNING INTEGRATION TEST COMPLETED SUCCESSFULLY!")
-        print(f"✅ {t} out of {n} FOMC servers successfully signed the rate change")
-        print(f"✅ Threshold signature verified against group public key")
-        print(f"✅ On-chain transaction executed with threshold signature")
-        
-    finally:
-        await rest.close()
+    # Read balances after
+    from_after, to_after = await asyncio.gather(
+        balance(rest, addr, from_coin), balance(rest, addr, to_coin)
+    )
+    print(f"💰 After:  from={from_after} to={to_after}")
+    print(f"📊 Δ from: {from_after - from_before}")
+    print(f"📊 Δ to:   {to_after - to_before}")
+    
+    print(f"\n🎉 THRESHOLD SIGNING INTEGRATION TEST COMPLETED SUCCESSFULLY!")
+    print(f"✅ {t} out of {n} FOMC servers successfully signed the rate change")
+    print(f"✅ Threshold signature verified against group public key")
+    print(f"✅ On-chain transaction executed with threshold signature")
     return 0
 
 
 def main():
+    # Opt-in: set the key and record the movement in one transaction (needs the
+    # republished module with set_key_and_record_interest_rate_movement_v5)
+    combined_set_key = bool_env("THRESHOLD_COMBINED_SET_KEY")
+    if "--combined-set-key" in sys.argv:
+        combined_set_key = True
+        sys.argv = [arg for arg in sys.argv if arg != "--combined-set-key"]
+
     # Parse command line arguments for threshold configuration
     if len(sys.argv) >= 4:
         try:
@@ -408,7 +566,10 @@ def main():
         print("- No single server can create a valid signature alone")
         sys.exit(2)
     
-    rc = asyncio.run(run_threshold_integration(input_text))
+    if uvloop is not None:
+        # libuv-backed loop: cheaper socket I/O for the REST submit/poll round-trips
+        uvloop.install()
+    rc = asyncio.run(run_threshold_integration(input_text, combined_set_key))
     sys.exit(rc)
 
 
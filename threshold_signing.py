@@ -27,23 +27,69 @@ Usage:
 """
 
 import os
+import functools
+import math
 import secrets
 import hashlib
 import base64
-from typing import List, Tuple, Dict, Optional
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import repeat
+from typing import List, Tuple, Dict, Optional, Union
+from py_ecc.optimized_bls12_381 import FQ12, final_exponentiate, neg
 from py_ecc.optimized_bls12_381.optimized_curve import (
-    G1, G2, add, multiply, curve_order, normalize,
+    G1, G2, add, double, multiply, curve_order, normalize,
 )
 from py_ecc.optimized_bls12_381.optimized_pairing import pairing
+from py_ecc.bls.ciphersuites import G2ProofOfPossession as bls
 from py_ecc.bls.hash_to_curve import hash_to_G2
-from py_ecc.bls.g2_primitives import G1_to_pubkey, G2_to_signature
-from aptos_sdk.bcs import Serializer
+from py_ecc.bls.g2_primitives import (
+    G1_to_pubkey, G2_to_signature, pubkey_to_G1, signature_to_G2, subgroup_check,
+)
+
+from env_utils import bool_env
+
+# Optional native backend: blspy wraps the blst C library. Its PopSchemeMPL uses the
+# same ciphersuite as py_ecc's G2ProofOfPossession, so signatures are byte-identical.
+# When installed it handles signing and verification; point arithmetic stays on py_ecc.
+try:
+    from blspy import G1Element, G2Element, PopSchemeMPL, PrivateKey  # type: ignore
+except ImportError:  # pragma: no cover - optional dependency
+    PopSchemeMPL = None
+
+# Optional Rust backend: py_arkworks_bls12381 exposes raw group arithmetic, hash-to-curve
+# and pairings over the same compressed encodings. It covers the G2 scalar multiplication
+# blspy lacks (signature combination) and replaces py_ecc everywhere when blspy is missing.
+try:
+    from py_arkworks_bls12381 import G1Point, G2Point, GT, Scalar  # type: ignore
+except ImportError:  # pragma: no cover - optional dependency
+    G2Point = None
+
+# Optional GMP integers: gmpy2.invert is an order of magnitude faster than pow(x, -1, p)
+# on 255-bit scalars. The other scalar arithmetic is small multiply/mod chains that
+# plain ints already handle faster than mpz once conversions are counted.
+try:
+    import gmpy2  # type: ignore
+except ImportError:  # pragma: no cover - optional dependency
+    gmpy2 = None
 
 # FOMC threshold configuration - now configurable
 # Examples: (4,3), (7,5), (10,7) - but supports any N and T <= N
 DEFAULT_N = 4  # Default total number of servers
 DEFAULT_T = 3  # Default threshold (need at least 3 servers to sign)
 
+# Progress output from key generation, signing and combination; set TS_VERBOSE=1 to see it
+VERBOSE = bool_env("TS_VERBOSE")
+
+def _log(*args) -> None:
+    """
+    print() that is silent unless VERBOSE is set.
+    
+    Arguments are still evaluated; messages that format big integers are built
+    and printed inside an explicit `if VERBOSE:` block instead.
+    """
+    if VERBOSE:
+        print(*args)
+
 class ThresholdConfig:
     """Configuration class for threshold signing parameters."""
     
@@ -99,40 +145,201 @@ def get_t() -> int:
     """Get the current threshold."""
     return _config.t
 
+_CURVE_ORDER_MPZ = gmpy2.mpz(curve_order) if gmpy2 is not None else None
+
 # Domain Separation Tag for BLS signatures (Aptos compatible)
 DST = b"BLS_SIG_BLS12381G2_XMD:SHA-256_SSWU_RO_NUL_"
 
+@functools.lru_cache(maxsize=64)
+def _hash_message_to_G2(bcs_message: bytes) -> tuple:
+    """Hash a message to G2 with the G2ProofOfPossession DST (cached: every signer hashes the same message)."""
+    return hash_to_G2(bcs_message, bls.DST, bls.xmd_hash_function)
+
+@functools.lru_cache(maxsize=64)
+def _ark_hash_message_to_G2(bcs_message: bytes):
+    """Arkworks counterpart of _hash_message_to_G2 (same DST, same point)."""
+    return G2Point.hash_to_curve(bcs_message, bls.DST)
+
+def _ark_verify(public_key_bytes: bytes, bcs_message: bytes, signature_bytes: bytes) -> bool:
+    """Check e(pk, H(m)) == e(G1, sig) with arkworks; False for malformed or invalid input."""
+    try:
+        pk_point = G1Point.from_compressed_bytes(public_key_bytes)
+        sig_point = G2Point.from_compressed_bytes(signature_bytes)
+    except ValueError:
+        return False
+    if pk_point == G1Point.identity():
+        return False
+    return GT.pairing_check([pk_point, -G1Point()], [_ark_hash_message_to_G2(bcs_message), sig_point])
+
 def mod_inv(x: int) -> int:
     """Compute modular inverse of x modulo curve_order."""
+    if gmpy2 is not None:
+        try:
+            return int(gmpy2.invert(x, _CURVE_ORDER_MPZ))
+        except ZeroDivisionError:
+            raise ValueError("base is not invertible for the given modulus") from None
     return pow(x, -1, curve_order)
 
 def lagrange_coefficient(i: int, ids: List[int]) -> int:
     """Compute Lagrange coefficient for server i given list of server IDs."""
+    p = curve_order
     num = den = 1
     for j in ids:
         if j == i:
             continue
-        num = (num * j) % curve_order
-        den = (den * (j - i)) % curve_order
-    return (num * mod_inv(den)) % curve_order
+        num = (num * j) % p
+        den = (den * (j - i)) % p
+    return (num * mod_inv(den)) % p
+
+@functools.lru_cache(maxsize=32)
+def _lagrange_consecutive(t: int) -> Tuple[int, ...]:
+    """
+    Lagrange coefficients at x=0 for ids 1..t, as (lambda_1, ..., lambda_t).
+    
+    For consecutive ids the product prod_{j != i} j / (j - i) is exactly
+    (-1)^(i-1) * C(t, i), so no modular inverse is needed.
+    """
+    return tuple((-1) ** (i - 1) * math.comb(t, i) % curve_order for i in range(1, t + 1))
+
+@functools.lru_cache(maxsize=64)
+def _lagrange_for_quorum(ids: Tuple[int, ...]) -> Tuple[int, ...]:
+    """
+    Lagrange coefficients at x=0 for a sorted quorum of server IDs, in the same order.
+    
+    Uses Montgomery's trick: the denominators are inverted together with a single
+    modular inverse plus three multiplications per server. Cached because a
+    committee signs many messages with the same quorum.
+    """
+    p = curve_order  # bind locally: the loops below are all modular arithmetic
+    nums = []
+    dens = []
+    for i in ids:
+        num = den = 1
+        for j in ids:
+            if j == i:
+                continue
+            num = (num * j) % p
+            den = (den * (j - i)) % p
+        nums.append(num)
+        dens.append(den)
+    
+    # prefix[k] = dens[0] * ... * dens[k-1]
+    prefix = [1]
+    for den in dens:
+        prefix.append((prefix[-1] * den) % p)
+    inv = mod_inv(prefix[-1])
+    coeffs = [0] * len(ids)
+    for k in range(len(ids) - 1, -1, -1):
+        # inv holds 1 / (dens[0] * ... * dens[k]) here
+        coeffs[k] = (nums[k] * inv * prefix[k]) % p
+        inv = (inv * dens[k]) % p
+    return tuple(coeffs)
+
+def batch_lagrange(ids: List[int]) -> Dict[int, int]:
+    """
+    Compute the Lagrange coefficients at x=0 for every server in ids.
+    
+    The common case of servers 1..t uses the closed form from _lagrange_consecutive;
+    any other quorum is computed once by _lagrange_for_quorum and then served from cache.
+    """
+    quorum = tuple(sorted(ids))
+    if quorum == tuple(range(1, len(quorum) + 1)):
+        return dict(zip(quorum, _lagrange_consecutive(len(quorum))))
+    return dict(zip(quorum, _lagrange_for_quorum(quorum)))
+
+def lagrange_combine(shares: Dict[int, int]) -> int:
+    """Interpolate scalar shares at x=0, i.e. sum(share_i * lambda_i) mod curve_order."""
+    coeffs = batch_lagrange(list(shares.keys()))
+    combined = 0
+    for i, share_value in shares.items():
+        combined += coeffs[i] * share_value
+    return combined % curve_order
+
+def multi_scalar_multiply(points: List[tuple], scalars: List[int], window: int = 4) -> Optional[tuple]:
+    """
+    Compute sum(scalar_i * point_i) with a windowed Straus multi-scalar multiplication.
+    
+    All points share one chain of doublings, so combining t points costs about as
+    many doublings as a single scalar multiplication instead of t times as many.
+    
+    Returns:
+        The resulting point, or None if every scalar is zero
+    """
+    mask = (1 << window) - 1
+    # tables[k][d] = d * points[k] for every window digit d
+    tables = []
+    for point in points:
+        table = [None, point]
+        for _ in range(2, mask + 1):
+            table.append(add(table[-1], point))
+        tables.append(table)
+    
+    top_bits = max((scalar.bit_length() for scalar in scalars), default=0)
+    acc = None
+    for shift in range(((top_bits + window - 1) // window - 1) * window, -1, -window):
+        if acc is not None:
+            for _ in range(window):
+                acc = double(acc)
+        for table, scalar in zip(tables, scalars):
+            digit = (scalar >> shift) & mask
+            if digit:
+                acc = table[digit] if acc is None else add(acc, table[digit])
+    return acc
+
+_G1_TABLE_WINDOW = 4
+
+@functools.lru_cache(maxsize=1)
+def _g1_fixed_base_table() -> List[List[tuple]]:
+    """Precompute d * 2^(w*k) * G1 for every w-bit window position k and digit d."""
+    window = _G1_TABLE_WINDOW
+    table = []
+    base = G1
+    for _ in range((curve_order.bit_length() + window - 1) // window):
+        row = [None, base]
+        for _ in range(2, 1 << window):
+            row.append(add(row[-1], base))
+        table.append(row)
+        base = add(row[-1], base)  # 2^window * base
+    return table
+
+def pubkey_from_scalar(scalar: int) -> bytes:
+    """
+    Return the compressed G1 public key for a secret scalar.
+    
+    Uses blspy when installed; otherwise a precomputed fixed-base table for G1,
+    which needs only one addition per 4-bit window and no doublings.
+    """
+    if PopSchemeMPL is not None:
+        return bytes(PrivateKey.from_bytes(scalar.to_bytes(32, 'big')).get_g1())
+    if G2Point is not None:
+        return bytes((G1Point() * Scalar(scalar)).to_compressed_bytes())
+    
+    mask = (1 << _G1_TABLE_WINDOW) - 1
+    point = None
+    for k, row in enumerate(_g1_fixed_base_table()):
+        digit = (scalar >> (_G1_TABLE_WINDOW * k)) & mask
+        if digit:
+            point = row[digit] if point is None else add(point, row[digit])
+    return G1_to_pubkey(point if point is not None else multiply(G1, 0))
 
 def generate_polynomial(degree: int, secret: int) -> List[int]:
     """Generate a random polynomial of given degree with constant term as secret."""
     poly = [secret]  # Constant term is the secret
-    # Generate random coefficients
-    for _ in range(degree):
-        coef = secrets.randbelow(curve_order)
+    # Generate random coefficients from one CSPRNG read: each takes 64 bytes reduced
+    # mod curve_order, so the modulo bias is below 2^-250 and no rejection is needed
+    raw = secrets.token_bytes(64 * degree)
+    for offset in range(0, len(raw), 64):
+        coef = int.from_bytes(raw[offset:offset + 64], 'big') % curve_order
         poly.append(coef)
     return poly
 
-def evaluate_polynomial(poly: List[int], x: int) -> int:
-    """Evaluate polynomial at point x using curve_order modular arithmetic."""
-    result = 0
-    for i, coef in enumerate(poly):
-        # Compute coef * x^i mod curve_order
-        term = (coef * pow(x, i, curve_order)) % curve_order
-        result = (result + term) % curve_order
-    return result
+def evaluate_polynomial_many(poly: List[int], xs: List[int]) -> List[int]:
+    """Evaluate polynomial at every point in xs, running one Horner pass over the coefficients."""
+    p = curve_order
+    results = [0] * len(xs)
+    for coef in reversed(poly):
+        results = [(acc * x + coef) % p for acc, x in zip(results, xs)]
+    return results
 
 def generate_threshold_keys() -> Tuple[Dict[int, bytes], Dict[int, bytes], bytes]:
     """
@@ -149,63 +356,69 @@ def generate_threshold_keys() -> Tuple[Dict[int, bytes], Dict[int, bytes], bytes
     config = get_threshold_config()
     n, t = config.n, config.t
     
-    print("\n=== FOMC THRESHOLD KEY GENERATION ===")
-    print(f"Generating keys for {n} servers with threshold {t}")
+    _log("\n=== FOMC THRESHOLD KEY GENERATION ===")
+    _log(f"Generating keys for {n} servers with threshold {t}")
     
     # Generate master secret
     master_secret = secrets.randbelow(curve_order)
-    print(f"Generated master secret: {master_secret % 1000000}")  # Show last 6 digits
+    if VERBOSE:
+        print(f"Generated master secret: {master_secret % 1000000}")  # Show last 6 digits
     
     # Generate polynomial of degree t-1 with master secret as constant term
     polynomial = generate_polynomial(t-1, master_secret)
-    print(f"Polynomial coefficients (mod 1000000): {[c % 1000000 for c in polynomial]}")
+    if VERBOSE:
+        print(f"Polynomial coefficients (mod 1000000): {[c % 1000000 for c in polynomial]}")
     
     # Generate secret shares for each server using polynomial evaluation
     private_keys = {}
     public_keys = {}
+    secret_shares = {}
     
-    for server_id in range(1, n+1):
-        # Evaluate polynomial at point server_id to get secret share
-        secret_share = evaluate_polynomial(polynomial, server_id)
+    # Evaluate polynomial at points 1..n to get every server's secret share
+    server_ids = list(range(1, n+1))
+    for server_id, secret_share in zip(server_ids, evaluate_polynomial_many(polynomial, server_ids)):
+        secret_shares[server_id] = secret_share
         
         # Convert to bytes for private key (32 bytes, big-endian)
         private_key_bytes = secret_share.to_bytes(32, 'big')
         private_keys[server_id] = private_key_bytes
         
-        # Generate public key (secret * G1_generator) - Min-PK scheme
-        public_key_point = multiply(G1, secret_share)
-        public_key_bytes = G1_to_pubkey(public_key_point)  # 48 bytes compressed
-        public_keys[server_id] = public_key_bytes
+        # Generate public key (secret * G1_generator) - Min-PK scheme, 48 bytes compressed
+        public_keys[server_id] = pubkey_from_scalar(secret_share)
         
-        print(f"Server {server_id} secret share: {secret_share % 1000000}")
+        if VERBOSE:
+            print(f"Server {server_id} secret share: {secret_share % 1000000}")
     
     # Generate group public key from master secret
-    group_public_key_point = multiply(G1, master_secret)
-    group_public_key = G1_to_pubkey(group_public_key_point)  # 48 bytes compressed
-    
-    print(f"Group public key derived from master secret")
-    
-    # Verify that secret shares can reconstruct master secret
-    print(f"\nVerifying Shamir's Secret Sharing reconstruction...")
-    test_indices = list(range(1, t+1))  # Use first t servers
-    reconstructed = 0
+    group_public_key = pubkey_from_scalar(master_secret)  # 48 bytes compressed
     
-    for i in test_indices:
-        coeff = lagrange_coefficient(i, test_indices)
-        share_value = int.from_bytes(private_keys[i], 'big')
-        term = (coeff * share_value) % curve_order
-        reconstructed = (reconstructed + term) % curve_order
+    _log(f"Group public key derived from master secret")
     
-    reconstruction_success = reconstructed == master_secret
-    print(f"Secret reconstruction: {'SUCCESS' if reconstruction_success else 'FAILED'}")
-    print(f"Original: {master_secret % 1000000}, Reconstructed: {reconstructed % 1000000}")
+    # Verify that secret shares can reconstruct master secret (diagnostic only)
+    if VERBOSE:
+        print(f"\nVerifying Shamir's Secret Sharing reconstruction...")
+        test_indices = list(range(1, t+1))  # Use first t servers
+        reconstructed = lagrange_combine(
+            {i: secret_shares[i] for i in test_indices}
+        )
+
+        reconstruction_success = reconstructed == master_secret
+        print(f"Secret reconstruction: {'SUCCESS' if reconstruction_success else 'FAILED'}")
+        print(f"Original: {master_secret % 1000000}, Reconstructed: {reconstructed % 1000000}")
     
     return private_keys, public_keys, group_public_key
 
+# BCS encodings of a bool
+_BCS_TRUE = b'\x01'
+_BCS_FALSE = b'\x00'
+
+@functools.lru_cache(maxsize=256)
 def create_bcs_message_for_fomc(abs_bps: int, is_increase: bool) -> bytes:
     """
     Create BCS-serialized message for FOMC rate change signing.
     
+    Results are cached; the encoding is deterministic and the returned bytes are immutable.
+    
     Args:
         abs_bps: Absolute value of basis points change
         is_increase: True if rate increase, False if decrease
@@ -213,79 +426,210 @@ def create_bcs_message_for_fomc(abs_bps: int, is_increase: bool) -> bytes:
     Returns:
         BCS-serialized bytes ready for signing
     """
-    serializer = Serializer()
-    
-    # Serialize u64 abs_bps
-    Serializer.u64(serializer, abs_bps)
+    # BCS layout: u64 abs_bps (8 bytes little-endian) followed by bool is_increase (1 byte)
+    return abs_bps.to_bytes(8, 'little') + (_BCS_TRUE if is_increase else _BCS_FALSE)
+
+def sign_bcs_message(private_key_bytes: Union[bytes, int], bcs_message: bytes) -> bytes:
+    """
+    Sign BCS-serialized message bytes using a private key - Aptos compatible.
     
-    # Serialize bool is_increase
-    Serializer.bool(serializer, is_increase)
+    The key may be given as 32 big-endian bytes or directly as its scalar.
+    """
+    if isinstance(private_key_bytes, int):
+        private_key_scalar = private_key_bytes
+        private_key_bytes = private_key_scalar.to_bytes(32, 'big')
+    else:
+        private_key_scalar = int.from_bytes(private_key_bytes, 'big')
     
-    # Get the final BCS bytes
-    bcs_bytes = serializer.output()
+    if PopSchemeMPL is not None:
+        try:
+            return bytes(PopSchemeMPL.sign(PrivateKey.from_bytes(private_key_bytes), bcs_message))
+        except ValueError as e:
+            print(f"Native BLS signing error, falling back to py_ecc: {e}")
+    elif G2Point is not None and 0 < private_key_scalar < curve_order:
+        return bytes((_ark_hash_message_to_G2(bcs_message) * Scalar(private_key_scalar)).to_compressed_bytes())
     
-    return bcs_bytes
-
-def sign_bcs_message(private_key_bytes: bytes, bcs_message: bytes) -> bytes:
-    """Sign BCS-serialized message bytes using a private key - Aptos compatible."""
     try:
-        # Use the same BLS import as the original integration test (ignore Pylance error)
-        from py_ecc.bls.ciphersuites import G2ProofOfPossession as bls
+        if not 0 < private_key_scalar < curve_order:
+            raise ValueError("private key scalar out of range")
         
-        # Convert private key bytes to integer
-        private_key_scalar = int.from_bytes(private_key_bytes, 'big')
-        
-        # Use the same signing method as the original integration test
-        signature_bytes = bls.Sign(private_key_scalar, bcs_message)  # type: ignore
-        
-        return bytes(signature_bytes)
+        # Same as G2ProofOfPossession.Sign, reusing the cached message point
+        signature_point = multiply(_hash_message_to_G2(bcs_message), private_key_scalar)
+        return G2_to_signature(signature_point)
         
     except Exception as e:
         print(f"BLS signing error: {e}")
         # Fallback to manual implementation
         H = hash_to_G2(bcs_message, DST, hashlib.sha256)  # type: ignore
-        private_key_scalar = int.from_bytes(private_key_bytes, 'big')
         signature_point = multiply(H, private_key_scalar)
         signature_bytes = G2_to_signature(signature_point)
         return signature_bytes
 
 def verify_signature(public_key_bytes: bytes, bcs_message: bytes, signature_bytes: bytes) -> bool:
     """Verify a signature against a public key and BCS message bytes."""
+    if PopSchemeMPL is not None:
+        try:
+            return PopSchemeMPL.verify(
+                G1Element.from_bytes(public_key_bytes), bcs_message, G2Element.from_bytes(signature_bytes)
+            )
+        except ValueError:
+            # Malformed key or signature bytes
+            return False
+    if G2Point is not None:
+        return _ark_verify(public_key_bytes, bcs_message, signature_bytes)
+    
     try:
-        # Use the same BLS import as the original integration test (ignore Pylance error)
-        from py_ecc.bls.ciphersuites import G2ProofOfPossession as bls
-        
-        # FIXED: Pass bytes directly to bls.Verify - it handles the conversion internally
-        # Don't convert to points manually, let py_ecc do it
-        return bls.Verify(public_key_bytes, bcs_message, signature_bytes)  # type: ignore
+        # Same checks as bls.Verify, but with the cached message point and both Miller
+        # loops folded into a single final exponentiation
+        if not bls.KeyValidate(public_key_bytes):
+            return False
+        signature_point = signature_to_G2(signature_bytes)  # type: ignore
+        if not subgroup_check(signature_point):
+            return False
+        product = pairing(signature_point, neg(G1), final_exponentiate=False) * pairing(
+            _hash_message_to_G2(bcs_message), pubkey_to_G1(public_key_bytes), final_exponentiate=False  # type: ignore
+        )
+        return final_exponentiate(product) == FQ12.one()
         
+    except ValueError:
+        # Malformed signature bytes
+        return False
     except Exception as e:
         print(f"BLS verification error: {e}")
         return False
 
+def sign_partial(server_id: int, private_key_bytes: bytes, bcs_message: bytes) -> Tuple[int, bytes]:
+    """
+    Produce one server's partial signature.
+    
+    Self-contained so it can be dispatched to worker processes. Partials are
+    verified together afterwards with check_partial_signatures.
+    
+    Returns:
+        Tuple of (server_id, partial signature bytes)
+    """
+    return server_id, sign_bcs_message(private_key_bytes, bcs_message)
+
+def batch_verify_partials(public_keys: Dict[int, bytes], bcs_message: bytes,
+                          partial_signatures: Dict[int, bytes]) -> bool:
+    """
+    Verify partial signatures on one message with a single two-pairing check.
+    
+    Checks e(sum r_i * sigma_i, G1) == e(H(m), sum r_i * pk_i) for random 64-bit
+    weights r_i, so invalid shares cannot cancel each other out.
+    
+    Args:
+        public_keys: Dict mapping server ID to public key bytes
+        bcs_message: The BCS-serialized message every partial signs
+        partial_signatures: Dict mapping server ID to partial signature bytes
+    
+    Returns:
+        True if every partial signature is valid for its server's public key
+    """
+    if PopSchemeMPL is not None:
+        # Native verification of each share is far cheaper than the pure-Python batch
+        return all(
+            verify_signature(public_keys[server_id], bcs_message, sig_bytes)
+            for server_id, sig_bytes in partial_signatures.items()
+        )
+    if G2Point is not None:
+        return _ark_batch_verify(public_keys, bcs_message, partial_signatures)
+    
+    try:
+        pk_points = []
+        sig_points = []
+        for server_id, sig_bytes in partial_signatures.items():
+            if not bls.KeyValidate(public_keys[server_id]):
+                return False
+            sig_point = signature_to_G2(sig_bytes)  # type: ignore
+            if not subgroup_check(sig_point):
+                return False
+            pk_points.append(pubkey_to_G1(public_keys[server_id]))  # type: ignore
+            sig_points.append(sig_point)
+        
+        # The same weights go into both sides; each side is a single MSM
+        weights = [secrets.randbits(64) | 1 for _ in sig_points]
+        aggregate_pk = multi_scalar_multiply(pk_points, weights)
+        aggregate_sig = multi_scalar_multiply(sig_points, weights)
+        
+        if aggregate_pk is None or aggregate_sig is None:
+            return False
+        
+        message_point = _hash_message_to_G2(bcs_message)
+        product = pairing(aggregate_sig, neg(G1), final_exponentiate=False) * pairing(
+            message_point, aggregate_pk, final_exponentiate=False
+        )
+        return final_exponentiate(product) == FQ12.one()
+    except Exception as e:
+        print(f"BLS batch verification error: {e}")
+        return False
+
+def _ark_batch_verify(public_keys: Dict[int, bytes], bcs_message: bytes,
+                      partial_signatures: Dict[int, bytes]) -> bool:
+    """batch_verify_partials on the arkworks backend: two multiexps and one pairing check."""
+    if not partial_signatures:
+        return False
+    try:
+        pk_points = [G1Point.from_compressed_bytes(public_keys[server_id]) for server_id in partial_signatures]
+        sig_points = [G2Point.from_compressed_bytes(sig_bytes) for sig_bytes in partial_signatures.values()]
+    except ValueError:
+        return False
+    if any(pk_point == G1Point.identity() for pk_point in pk_points):
+        return False
+    
+    weights = [Scalar(secrets.randbits(64) | 1) for _ in sig_points]
+    return GT.pairing_check(
+        [G1Point.multiexp_unchecked(pk_points, weights), -G1Point()],
+        [_ark_hash_message_to_G2(bcs_message), G2Point.multiexp_unchecked(sig_points, weights)],
+    )
+
+def check_partial_signatures(public_keys: Dict[int, bytes], bcs_message: bytes,
+                             partial_signatures: Dict[int, bytes]) -> None:
+    """
+    Batch-verify partial signatures, falling back to per-server checks to name a bad share.
+    
+    Raises:
+        ValueError: If any partial signature does not verify
+    """
+    if batch_verify_partials(public_keys, bcs_message, partial_signatures):
+        return
+    for server_id, partial_sig in partial_signatures.items():
+        if not verify_signature(public_keys[server_id], bcs_message, partial_sig):
+            raise ValueError(f"Partial signature verification failed for server {server_id}")
+    raise ValueError("Partial signature batch verification failed")
+
+# Below this many signers, pool startup costs more than signing sequentially
+_PARALLEL_SIGNING_MIN = 4
+
 def generate_threshold_signatures(private_keys: Dict[int, bytes], bcs_message: bytes,
-                                 indices: List[int], public_keys: Dict[int, bytes]) -> Dict[int, bytes]:
+                                 indices: List[int], public_keys: Dict[int, bytes],
+                                 verify_each: bool = False,
+                                 allow_processes: bool = True) -> Dict[int, bytes]:
     """
     Generate partial signatures by signing the message with individual private keys directly.
     
     Each signer creates a partial signature using their secret share without any scaling.
     The Lagrange interpolation will be applied later during signature combination.
-    Each partial signature is verified against its corresponding public key before returning.
+    Shares produced here come from keys we hold, so they are only verified against
+    their public keys when verify_each is set; shares received from other servers
+    should go through check_partial_signatures instead.
     
     Args:
         private_keys: Dict mapping server ID to private key bytes (secret shares)
         bcs_message: The BCS-serialized message to sign
         indices: List of server IDs that will participate in signing
         public_keys: Dict mapping server ID to public key bytes for verification
+        verify_each: Batch-verify the partial signatures before returning
+        allow_processes: Set to False when called from a worker thread of a running
+            event loop, where forking is unsafe; py_ecc then signs sequentially
     
     Returns:
         Dict mapping server ID to partial signature bytes
     """
-    config = get_threshold_config()
-    t = config.t
+    t = _config.t
     
-    print(f"\n=== FOMC PARTIAL SIGNATURE GENERATION ===")
-    print(f"Generating partial signatures from servers: {indices[:t]}")
+    _log(f"\n=== FOMC PARTIAL SIGNATURE GENERATION ===")
+    _log(f"Generating partial signatures from servers: {indices[:t]}")
     
     if len(indices) < t:
         raise ValueError(f"Need at least {t} signers, got {len(indices)}")
@@ -294,26 +638,31 @@ def generate_threshold_signatures(private_keys: Dict[int, bytes], bcs_message: b
     signing_indices = indices[:t]
     
     # Each signer signs the message with their individual private key (no scaling)
-    partial_signatures = {}
+    signing_keys = [private_keys[server_id] for server_id in signing_indices]
+    workers = min(len(signing_indices), os.cpu_count() or 1)
+    native = PopSchemeMPL is not None or G2Point is not None
+    if len(signing_indices) >= _PARALLEL_SIGNING_MIN and workers > 1 and (native or allow_processes):
+        # Native backends sign in well under a millisecond, so threads (which run in parallel
+        # wherever the extension releases the GIL) beat paying process startup per call;
+        # pure-Python py_ecc holds the GIL throughout and needs processes
+        executor_cls = ThreadPoolExecutor if native else ProcessPoolExecutor
+        with executor_cls(max_workers=workers) as pool:
+            partial_signatures = dict(pool.map(sign_partial, signing_indices, signing_keys, repeat(bcs_message)))
+    else:
+        partial_signatures = dict(map(sign_partial, signing_indices, signing_keys, repeat(bcs_message)))
     
-    for server_id in signing_indices:
-        # Sign BCS message directly with the private key share
-        partial_sig = sign_bcs_message(private_keys[server_id], bcs_message)
-        
-        # Verify the partial signature using the corresponding public key
-        print(f"Server {server_id}: verifying partial signature...")
-        is_valid = verify_signature(public_keys[server_id], bcs_message, partial_sig)
-        
-        if not is_valid:
-            raise ValueError(f"Partial signature verification failed for server {server_id}")
-        
-        partial_signatures[server_id] = partial_sig
-        
-        # Get private key scalar for logging
-        private_key_scalar = int.from_bytes(private_keys[server_id], 'big')
-        print(f"Server {server_id}: ✅ partial signature verified (scalar={private_key_scalar % 1000000})")
+    if VERBOSE:
+        for server_id in signing_indices:
+            private_key_scalar = int.from_bytes(private_keys[server_id], 'big')
+            print(f"Server {server_id}: partial signature created (scalar={private_key_scalar % 1000000})")
     
-    print(f"Partial signature generation and verification complete!")
+    if verify_each:
+        # Verify all partial signatures against their public keys in one batch
+        _log(f"Verifying {len(partial_signatures)} partial signatures...")
+        check_partial_signatures(public_keys, bcs_message, partial_signatures)
+        _log(f"✅ All partial signatures verified")
+    
+    _log(f"Partial signature generation complete!")
     return partial_signatures
 
 def combine_threshold_signatures(partial_signatures: Dict[int, bytes]) -> bytes:
@@ -329,11 +678,10 @@ def combine_threshold_signatures(partial_signatures: Dict[int, bytes]) -> bytes:
     Returns:
         Combined threshold signature bytes
     """
-    config = get_threshold_config()
-    t = config.t
+    t = _config.t
     
-    print(f"\n=== FOMC THRESHOLD SIGNATURE COMBINATION ===")
-    print(f"Combining {len(partial_signatures)} partial signatures")
+    _log(f"\n=== FOMC THRESHOLD SIGNATURE COMBINATION ===")
+    _log(f"Combining {len(partial_signatures)} partial signatures")
     
     if len(partial_signatures) < t:
         raise ValueError(f"Need at least {t} partial signatures, got {len(partial_signatures)}")
@@ -342,49 +690,85 @@ def combine_threshold_signatures(partial_signatures: Dict[int, bytes]) -> bytes:
     signing_indices = list(partial_signatures.keys())
     
     # Compute Lagrange coefficients for reconstruction at x=0
-    lagrange_coeffs = {}
-    for server_id in signing_indices:
-        coeff = lagrange_coefficient(server_id, signing_indices)
-        lagrange_coeffs[server_id] = coeff
-        print(f"Server {server_id}: Lagrange coefficient = {coeff % 1000}")
-    
-    # Import at the top of the function to avoid repeated imports
-    from py_ecc.bls.g2_primitives import signature_to_G2
-    
-    # Scale each partial signature by its Lagrange coefficient and aggregate
-    combined_point = None
-    
-    for server_id, sig_bytes in partial_signatures.items():
-        # Convert signature bytes to G2 point
-        sig_point = signature_to_G2(sig_bytes)  # type: ignore
-        
-        # Scale by Lagrange coefficient
-        scaled_sig_point = multiply(sig_point, lagrange_coeffs[server_id])
+    lagrange_coeffs = batch_lagrange(signing_indices)
+    if VERBOSE:
+        for server_id in signing_indices:
+            print(f"Server {server_id}: Lagrange coefficient = {lagrange_coeffs[server_id] % 1000}")
+    
+    # Scale each partial signature by its Lagrange coefficient and aggregate in one MSM
+    scalars = [lagrange_coeffs[server_id] for server_id in signing_indices]
+    if G2Point is not None:
+        # Skip per-share subgroup checks: any small-order component survives into the
+        # combined signature, whose subgroup membership is checked when it is verified
+        points = [G2Point.from_compressed_bytes_unchecked(partial_signatures[server_id])
+                  for server_id in signing_indices]
+        combined_point = G2Point.multiexp_unchecked(points, [Scalar(scalar) for scalar in scalars])
+        combined_sig = bytes(combined_point.to_compressed_bytes())
+    else:
+        points = [signature_to_G2(partial_signatures[server_id]) for server_id in signing_indices]  # type: ignore
+        combined_point = multi_scalar_multiply(points, scalars)
         
-        # Add to combined signature
         if combined_point is None:
-            combined_point = scaled_sig_point
-        else:
-            combined_point = add(combined_point, scaled_sig_point)
-        
-        print(f"Server {server_id}: scaled signature by coefficient {lagrange_coeffs[server_id] % 1000}")
+            raise ValueError("No signatures to combine")
+        combined_sig = G2_to_signature(combined_point)
     
-    # Convert back to bytes - ensure combined_point is not None
-    if combined_point is None:
-        raise ValueError("No signatures to combine")
-    combined_sig = G2_to_signature(combined_point)
-    
-    print(f"Threshold signature combination complete!")
+    _log(f"Threshold signature combination complete!")
     return combined_sig
 
+def _find_bad_partials(public_keys: Dict[int, bytes], bcs_message: bytes,
+                       partial_signatures: Dict[int, bytes], server_ids: List[int]) -> List[int]:
+    """Bisect server_ids with batch checks and return the servers whose partials are invalid."""
+    subset = {server_id: partial_signatures[server_id] for server_id in server_ids}
+    if batch_verify_partials(public_keys, bcs_message, subset):
+        return []
+    if len(server_ids) == 1:
+        return list(server_ids)
+    mid = len(server_ids) // 2
+    return (_find_bad_partials(public_keys, bcs_message, partial_signatures, server_ids[:mid])
+            + _find_bad_partials(public_keys, bcs_message, partial_signatures, server_ids[mid:]))
+
+def verify_threshold_with_fallback(group_public_key: bytes, bcs_message: bytes,
+                                   partial_signatures: Dict[int, bytes],
+                                   public_keys: Dict[int, bytes]) -> Tuple[bool, List[int]]:
+    """
+    Optimistically combine and verify partial signatures, isolating bad shares only on failure.
+    
+    The happy path costs one combination and one verification against the group key.
+    If that fails, the partials are bisected with batch checks so a bad share is found
+    in O(log t) checks instead of one verification per server.
+    
+    Args:
+        group_public_key: The group public key bytes
+        bcs_message: The BCS-serialized message that was signed
+        partial_signatures: Dict mapping server ID to partial signature bytes
+        public_keys: Dict mapping server ID to public key bytes
+    
+    Returns:
+        Tuple of (valid, bad server IDs). The list is empty on success, and also when
+        every partial is valid but the shares do not belong to group_public_key.
+    """
+    try:
+        combined_sig = combine_threshold_signatures(partial_signatures)
+    except ValueError:
+        # Too few partials or an undecodable share; the bisection below names the latter
+        combined_sig = None
+    if combined_sig is not None and verify_signature(group_public_key, bcs_message, combined_sig):
+        return True, []
+    return False, _find_bad_partials(public_keys, bcs_message, partial_signatures, list(partial_signatures))
+
 # PEM utility functions for BLS12-381 keys
+def _encode_pem(label: str, data: bytes) -> str:
+    """Frame bytes as a PEM block with 64-character base64 lines."""
+    b64_data = base64.b64encode(data).decode('ascii')
+    # 32-byte private keys and 48-byte public keys encode to at most 64 characters,
+    # so the body is a single line and only longer payloads need splitting
+    if len(b64_data) > 64:
+        b64_data = '\n'.join([b64_data[i:i+64] for i in range(0, len(b64_data), 64)])
+    return f"-----BEGIN {label}-----\n{b64_data}\n-----END {label}-----\n"
+
 def encode_bls_private_key_pem(private_key_bytes: bytes) -> str:
     """Encode BLS12-381 private key bytes to PEM format."""
-    b64_data = base64.b64encode(private_key_bytes).decode('ascii')
-    # Split into 64-character lines
-    lines = [b64_data[i:i+64] for i in range(0, len(b64_data), 64)]
-    pem_content = '\n'.join(lines)
-    return f"-----BEGIN BLS12381 PRIVATE KEY-----\n{pem_content}\n-----END BLS12381 PRIVATE KEY-----\n"
+    return _encode_pem("BLS12381 PRIVATE KEY", private_key_bytes)
 
 def decode_bls_private_key_pem(pem_data: str) -> bytes:
     """Decode BLS12-381 private key from PEM format to bytes."""
@@ -408,11 +792,7 @@ def decode_bls_private_key_pem(pem_data: str) -> bytes:
 
 def encode_bls_public_key_pem(public_key_bytes: bytes) -> str:
     """Encode BLS12-381 public key bytes to PEM format."""
-    b64_data = base64.b64encode(public_key_bytes).decode('ascii')
-    # Split into 64-character lines
-    lines = [b64_data[i:i+64] for i in range(0, len(b64_data), 64)]
-    pem_content = '\n'.join(lines)
-    return f"-----BEGIN BLS12381 PUBLIC KEY-----\n{pem_content}\n-----END BLS12381 PUBLIC KEY-----\n"
+    return _encode_pem("BLS12381 PUBLIC KEY", public_key_bytes)
 
 def main(n: int = DEFAULT_N, t: int = DEFAULT_T) -> None:
     """
@@ -62,6 +62,11 @@ async def update_contract_public_key():
     # Connect to testnet
     rest = RestClient("https://fullnode.testnet.aptoslabs.com/v1")
     
+    # Fetch the sequence number and chain id while the payload is being built;
+    # create_bcs_signed_transaction would otherwise request them one after the other
+    sequence_task = asyncio.create_task(rest.account_sequence_number(account.address()))
+    chain_id_task = asyncio.create_task(rest.chain_id())
+    
     try:
         # Get module address
         try:
@@ -79,13 +84,14 @@ async def update_contract_public_key():
             "set_bls_public_key",
             [],
             [
-                TransactionArgument(list(group_public_key), Serializer.sequence_serializer(Serializer.u8)),
+                TransactionArgument(group_public_key, Serializer.to_bytes),
             ],
         )
         payload = TransactionPayload(entry)
         
         print("✍️  Signing and submitting transaction...")
-        signed = await rest.create_bcs_signed_transaction(account, payload)
+        sequence_number, _ = await asyncio.gather(sequence_task, chain_id_task)
+        signed = await rest.create_bcs_signed_transaction(account, payload, sequence_number=sequence_number)
         txh = await rest.submit_bcs_transaction(signed)
         
         print("⏳ Waiting for transaction confirmation...")
@@ -100,6 +106,10 @@ async def update_contract_public_key():
         print(f"❌ Error updating contract: {e}")
         return False
     finally:
+        # Settle the prefetches (e.g. after an early return) before closing the client
+        sequence_task.cancel()
+        chain_id_task.cancel()
+        await asyncio.gather(sequence_task, chain_id_task, return_exceptions=True)
         await rest.close()
 
 def main():
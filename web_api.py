@@ -10,6 +10,7 @@ This API provides an endpoint that:
 """
 
 import os
+import functools
 import logging
 from typing import Optional
 from fastapi import FastAPI, HTTPException
@@ -18,7 +19,7 @@ from aptos_sdk.bcs import Serializer
 
 # Import existing functionality
 from chat import (
-    warmup,
+    get_warmup,
     extract,
     get_article_text,
     is_ollama_available,
@@ -64,8 +65,15 @@ def _load_dotenv(path: str = ".env") -> None:
     except Exception:
         pass
 
+@functools.lru_cache(maxsize=1)
 def _get_bls_keys() -> tuple[int, bytes]:
-    """Get BLS private key and derive public key."""
+    """
+    Get BLS private key and derive public key.
+    
+    Cached after the first successful load (the key is fixed for the life of the
+    process; restart to rotate it). Failures are not cached, so a missing key is
+    picked up once it is configured.
+    """
     _load_dotenv()
     priv_hex = os.environ.get("BLS_PRIVATE_KEY")
     if not priv_hex:
@@ -77,8 +85,9 @@ def _get_bls_keys() -> tuple[int, bytes]:
     pk = bls.SkToPk(sk)
     return sk, bytes(pk)
 
+@functools.lru_cache(maxsize=128)
 def _bls_message(abs_bps: int, is_increase: bool) -> bytes:
-    """Create BLS message from rate change data."""
+    """Create BLS message from rate change data (cached: only a few dozen rate changes occur)."""
     s = Serializer()
     s.u64(abs_bps)
     s.bool(is_increase)
@@ -100,7 +109,7 @@ def extract_rate_change_from_text_llm(text: str) -> Optional[int]:
         return None
 
     try:
-        messages = warmup()
+        messages = get_warmup()
         return extract(text, messages)
     except OllamaUnavailableError as e:
         logger.error(f"Ollama unavailable: {e}")
@@ -118,10 +127,17 @@ def sign_rate_change(rate_change: int) -> str:
     Returns:
         Hex-encoded BLS signature
     """
-    abs_bps = abs(rate_change)
-    is_increase = rate_change > 0
+    return _sign_bls_message(abs(rate_change), rate_change > 0)
+
+@functools.lru_cache(maxsize=128)
+def _sign_bls_message(abs_bps: int, is_increase: bool) -> str:
+    """
+    Sign one rate change and return the hex signature.
     
-    # Get BLS keys
+    BLS signing is deterministic and the key is fixed per process, so repeated rate
+    changes reuse the signature instead of redoing hash-to-curve and the G2 multiply.
+    """
+    # Get BLS keys (loaded once per process)
     sk, pk = _get_bls_keys()
     
     # Create message